@@ -7,7 +7,7 @@ from PySDM.backends import CPU, GPU
 from PySDM.products import WallTime
 
 from PySDM_examples.Arabas_et_al_2015 import Settings
-from PySDM_examples.Szumowski_et_al_1998 import Simulation, Storage
+from PySDM_examples.Szumowski_et_al_1998 import MemoryStorage, Simulation
 
 
 def reload_cpu_backend():
@@ -53,7 +53,7 @@ def main():
         times[key] = []
         for sd in n_sd:
             settings.n_sd_per_gridbox = sd
-            storage = Storage()
+            storage = MemoryStorage()
             simulation = Simulation(settings, storage, None, backend)
             simulation.reinit(products=[WallTime()])
             simulation.run()
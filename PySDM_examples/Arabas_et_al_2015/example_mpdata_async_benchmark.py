@@ -0,0 +1,58 @@
+import numba
+from matplotlib import pyplot as plt
+from PySDM import Formulae
+from PySDM.products import WallTime
+
+from PySDM_examples.Arabas_et_al_2015 import Settings
+from PySDM_examples.Szumowski_et_al_1998 import MemoryStorage, Simulation
+
+
+def main():
+    settings = Settings(Formulae())
+
+    settings.n_sd_per_gridbox = 8
+    settings.simulation_time = settings.dt * 10
+    settings.output_interval = settings.dt * 5
+    settings.processes = {
+        "particle advection": True,
+        "fluid advection": True,
+        "coalescence": True,
+        "condensation": False,
+        "sedimentation": True,
+        "freezing": False,
+        "breakup": False,
+    }
+
+    grids = (16, 32)
+    initial_n_threads = numba.get_num_threads()
+    n_threads = sorted({1, initial_n_threads})
+
+    times = {}
+    try:
+        for n_thread in n_threads:
+            numba.set_num_threads(n_thread)
+            for asynchronous in (False, True):
+                settings.mpdata_asynchronous = asynchronous
+                key = f"n_threads={n_thread} ({'async' if asynchronous else 'sync'})"
+                times[key] = []
+                for grid in grids:
+                    settings.grid = (grid, grid)
+                    storage = MemoryStorage()
+                    simulation = Simulation(settings, storage, None)
+                    simulation.reinit(products=[WallTime()])
+                    simulation.run()
+                    times[key].append(storage.load("wall time")[-1])
+    finally:
+        numba.set_num_threads(initial_n_threads)
+
+    for mode, t in times.items():
+        plt.plot(grids, t, label=mode, marker="o")
+    plt.xlabel("grid size (nx = nz)")
+    plt.ylabel("wall time [s]")
+    plt.legend()
+    plt.loglog()
+    plt.savefig("benchmark_mpdata_async.pdf", format="pdf")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import os
+from time import perf_counter
+
+from PySDM import Formulae
+
+from PySDM_examples.Arabas_et_al_2015 import Settings
+from PySDM_examples.Szumowski_et_al_1998 import Simulation, Storage
+from PySDM_examples.Szumowski_et_al_1998.storage_codecs import (
+    BitRound,
+    Float16,
+    Lossless,
+    Sparse,
+)
+
+
+def main():
+    settings = Settings(Formulae())
+
+    settings.grid = (25, 25)
+    settings.simulation_time = settings.dt * 100
+    settings.output_interval = settings.dt * 10
+
+    reference = Storage()
+    simulation = Simulation(settings, reference, None)
+    simulation.reinit()
+    simulation.run()
+
+    frames = [
+        (name, step, reference.load(name, step))
+        for name, product in simulation.products.items()
+        if len(product.shape) > 1
+        for step in settings.output_steps
+    ]
+    raw_bytes = sum(data.nbytes for _, _, data in frames)
+
+    codecs = {
+        "none (.npy)": None,
+        "lossless (deflate)": Lossless(),
+        "float16": Float16(),
+        "float16 + deflate": Float16(compress=True),
+        "bit-rounding (7 bits) + deflate": BitRound(keepbits=7),
+        "sparse": Sparse(),
+        "sparse + deflate": Sparse(compress=True),
+    }
+    print(f"{'codec':>32} {'ratio':>8} {'write [MB/s]':>13} {'read [MB/s]':>12}")
+    for label, codec in codecs.items():
+        storage = Storage(
+            codecs=None if codec is None else {name: codec for name, _, _ in frames}
+        )
+        storage.init(settings)
+
+        start = perf_counter()
+        for name, step, data in frames:
+            storage.save(data, step, name)
+        write_time = perf_counter() - start
+
+        start = perf_counter()
+        for name, step, _ in frames:
+            storage.load(name, step)
+        read_time = perf_counter() - start
+
+        stored_bytes = sum(
+            entry.stat().st_size
+            for entry in os.scandir(storage.dir_path)
+            if not entry.name.endswith(".stats.npy")
+        )
+        print(
+            f"{label:>32} {raw_bytes / stored_bytes:8.2f}"
+            f" {raw_bytes / write_time / 1e6:13.1f} {raw_bytes / read_time / 1e6:12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+from time import perf_counter
+
+import numpy as np
+
+from PySDM_examples.Arabas_et_al_2015 import Settings
+from PySDM_examples.Szumowski_et_al_1998.fields import (
+    NondivergentVectorField2D,
+    nondivergent_vector_field_2d,
+)
+from PySDM_examples.utils.validation import LEVELS, validation_level
+
+
+def main():
+    settings = Settings()
+    n_steps = 200
+    grids = (8, 16, 32, 64)
+
+    def stream_function(xX, zZ, t):
+        return settings.stream_function(xX, zZ, t) * np.cos(2 * np.pi * t / 600)
+
+    print(f"{'per-step advector evaluation [us]':>42}", *(f"{g:>4}^2" for g in grids))
+    for label, make in (
+        (
+            "nondivergent_vector_field_2d()",
+            lambda grid: lambda t: nondivergent_vector_field_2d(
+                grid, settings.size, settings.dt, stream_function, t
+            ),
+        ),
+        (
+            "NondivergentVectorField2D",
+            lambda grid: NondivergentVectorField2D(
+                grid, settings.size, settings.dt, stream_function
+            ),
+        ),
+    ):
+        for level in LEVELS:
+            times = []
+            with validation_level(level):
+                for grid in grids:
+                    advector = make((grid, grid))
+                    start = perf_counter()
+                    for step in range(n_steps):
+                        advector((step + 0.5) * settings.dt)
+                    times.append((perf_counter() - start) / n_steps * 1e6)
+            print(f"{label + ' (' + level + ')':>42}", *(f"{t:6.1f}" for t in times))
+
+
+if __name__ == "__main__":
+    main()
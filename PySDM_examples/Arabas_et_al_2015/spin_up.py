@@ -6,9 +6,10 @@ class SpinUp:
         self.spin_up_steps = spin_up_steps
         particulator.observers.append(self)
         self.particulator = particulator
-        self.set(Collision, "enable", False)
-        self.set(Displacement, "enable_sedimentation", False)
-        self.set(Freezing, "enable", False)
+        if particulator.n_steps < spin_up_steps:
+            self.set(Collision, "enable", False)
+            self.set(Displacement, "enable_sedimentation", False)
+            self.set(Freezing, "enable", False)
 
     def notify(self):
         if self.particulator.n_steps == self.spin_up_steps:
@@ -98,6 +98,10 @@ class Common:
         self.mpdata_iga = True
         self.mpdata_fct = True
         self.mpdata_tot = True
+        self.mpdata_asynchronous = False
+        self.mpdata_n_threads = None
+        self.mpdata_stream_function_period = None
+        self.mpdata_courant_check_every = 1
 
         key_packages = [PySDM, PyMPDATA, numba, numpy, scipy]
         try:
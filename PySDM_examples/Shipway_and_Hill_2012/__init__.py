@@ -1,4 +1,6 @@
 # pylint: disable=invalid-name
+from .ensemble import Ensemble
+from .output_schedule import OutputSchedule
 from .plot import plot
 from .settings import Settings
 from .simulation import Simulation
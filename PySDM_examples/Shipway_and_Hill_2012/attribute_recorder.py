@@ -0,0 +1,60 @@
+import os
+from collections.abc import Mapping
+
+import numpy as np
+
+
+class AttributeRecorder(Mapping):
+    """preallocated buffers of shape `(n_snapshots, *attribute_shape)` (with
+    the last dimension sized for the initial number of super-droplets, entries
+    past those remaining at a given snapshot being left zero, see `count`) into
+    which snapshots of the `attributes` (a dict mapping names to dtypes the values
+    are cast to, e.g., `np.float32`, or `None` to keep the original ones) are
+    written in place; if `path` is given, the buffers are memory-mapped `.npy`
+    files in that directory (written to disk as the simulation progresses);
+    indexing by attribute name returns a list of recorded snapshots (views)"""
+
+    def __init__(self, particulator, attributes: dict, n_snapshots: int, path=None):
+        self.path = path
+        self.count = np.zeros(n_snapshots, dtype=int)
+        self.recorded = np.zeros(n_snapshots, dtype=bool)
+        self.buffers = {}
+        if path is not None:
+            os.makedirs(path, exist_ok=True)
+        for name, dtype in attributes.items():
+            storage = particulator.attributes[name]
+            shape = (n_snapshots, *storage.shape)
+            dtype = np.dtype(storage.dtype if dtype is None else dtype)
+            if path is None:
+                self.buffers[name] = np.zeros(shape, dtype=dtype)
+            else:
+                self.buffers[name] = np.lib.format.open_memmap(
+                    os.path.join(path, f"{name.replace(' ', '_')}.npy"),
+                    mode="w+",
+                    dtype=dtype,
+                    shape=shape,
+                )
+
+    def record(self, particulator, index: int):
+        for name, buffer in self.buffers.items():
+            data = particulator.attributes[name].to_ndarray()
+            np.copyto(buffer[index, ..., : data.shape[-1]], data, casting="same_kind")
+            self.count[index] = data.shape[-1]
+        self.recorded[index] = True
+
+    def flush(self):
+        for buffer in self.buffers.values():
+            if isinstance(buffer, np.memmap):
+                buffer.flush()
+
+    def __getitem__(self, name: str) -> list:
+        return [
+            self.buffers[name][index, ..., : self.count[index]]
+            for index in np.flatnonzero(self.recorded)
+        ]
+
+    def __iter__(self):
+        return iter(self.buffers)
+
+    def __len__(self):
+        return len(self.buffers)
@@ -0,0 +1,144 @@
+import traceback
+from collections import namedtuple
+from concurrent.futures import as_completed
+
+import numpy as np
+from PySDM.backends import CPU
+
+from PySDM_examples.Shipway_and_Hill_2012.settings import Settings
+from PySDM_examples.Shipway_and_Hill_2012.simulation import Simulation
+from PySDM_examples.utils import DummyController, process_pool
+
+Result = namedtuple("Result", "products z t members failures")
+
+_BACKENDS = {}
+
+
+def formulae_key(formulae) -> tuple:
+    """options (component names, flags and constants) the backend methods
+    are compiled for, i.e. all but the seed (and the seed-derived constant)"""
+    key = []
+    for option, value in vars(formulae).items():
+        if option in ("seed", "trivia"):
+            continue
+        if option == "constants":
+            key += [
+                (name, repr(constant))
+                for name, constant in value._asdict().items()
+                if name != "default_random_seed"
+            ]
+        else:
+            key.append((option, getattr(value, "__name__", repr(value))))
+    return tuple(key)
+
+
+def warm_backend(backend_class):
+    """backend factory reusing (within a process) backend instances, and hence
+    their JIT-compiled methods, for formulae differing at most in the seed"""
+
+    def factory(formulae):
+        key = (backend_class, formulae_key(formulae))
+        if key not in _BACKENDS:
+            _BACKENDS[key] = backend_class(formulae=formulae)
+        _BACKENDS[key].formulae = formulae
+        return _BACKENDS[key]
+
+    return factory
+
+
+def run_member(simulation_class, settings_class, settings_kwargs, products, backend):
+    """runs a single member (in a worker process) returning a dict with `z`, `t`
+    and the profiles of `products` (all if `None`), or the traceback on failure"""
+    try:
+        settings = settings_class(**settings_kwargs)
+        simulation = simulation_class(settings, backend=warm_backend(backend))
+        output = simulation.run().products
+        return {
+            name: data
+            for name, data in output.items()
+            if name in ("z", "t")
+            or (data.ndim == 2 and (products is None or name in products))
+        }
+    except Exception:  # pylint: disable=broad-exception-caught
+        return traceback.format_exc()
+
+
+class Ensemble:
+    """runs `simulation_class` (e.g., `deJong_Mackay_2022.Simulation1D`) for each
+    of the `members` (dicts of keyword arguments to `settings_class`) in a pool of
+    `n_processes` worker processes which keep compiled backends between members;
+    `run()` returns profiles of `products` stacked into `members × z × t` arrays
+    on a common height grid (NaN where a member's domain does not extend and for
+    failed members, tracebacks of which are kept in `failures`)"""
+
+    def __init__(
+        self,
+        members,
+        settings_class=Settings,
+        simulation_class=Simulation,
+        products=None,
+        n_processes=None,
+        backend=CPU,
+    ):
+        self.members = list(members)
+        self.settings_class = settings_class
+        self.simulation_class = simulation_class
+        self.products = products
+        self.n_processes = n_processes
+        self.backend = backend
+
+    def run(self, controller=None) -> Result:
+        controller = controller or DummyController()
+        outputs = {}
+        failures = {}
+        with controller, process_pool(self.n_processes) as pool:
+            futures = {
+                pool.submit(
+                    run_member,
+                    self.simulation_class,
+                    self.settings_class,
+                    settings_kwargs,
+                    self.products,
+                    self.backend,
+                ): member
+                for member, settings_kwargs in enumerate(self.members)
+            }
+            for future in as_completed(futures):
+                member = futures[future]
+                try:
+                    output = future.result()
+                except Exception:  # pylint: disable=broad-exception-caught
+                    output = traceback.format_exc()
+                if isinstance(output, str):
+                    failures[member] = output
+                else:
+                    outputs[member] = output
+                controller.set_percent(
+                    (len(outputs) + len(failures)) / len(self.members)
+                )
+                if controller.panic:
+                    for pending in futures:
+                        pending.cancel()
+                    break
+        return self._stack(outputs, failures)
+
+    def _stack(self, outputs, failures) -> Result:
+        if not outputs:
+            return Result({}, None, None, self.members, failures)
+        t = next(iter(outputs.values()))["t"]
+        for output in outputs.values():
+            if output["t"].shape != t.shape or not np.allclose(output["t"], t):
+                raise ValueError("members differ in output times")
+        z = np.unique(np.concatenate([np.round(o["z"], 6) for o in outputs.values()]))
+        products = {}
+        for member, output in outputs.items():
+            levels = np.searchsorted(z, np.round(output["z"], 6))
+            for name, data in output.items():
+                if name in ("z", "t"):
+                    continue
+                if name not in products:
+                    products[name] = np.full(
+                        (len(self.members), len(z), len(t)), np.nan
+                    )
+                products[name][member, levels, :] = data
+        return Result(products, z, t, self.members, failures)
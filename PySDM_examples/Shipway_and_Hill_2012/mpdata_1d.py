@@ -3,6 +3,8 @@ from PyMPDATA import Options, ScalarField, Solver, Stepper, VectorField
 from PyMPDATA.boundary_conditions import Extrapolated
 from PySDM.impl import arakawa_c
 
+from PySDM_examples.utils.validation import checks_enabled
+
 
 class MPDATA_1D:
     def __init__(
@@ -13,10 +15,21 @@ class MPDATA_1D:
         advectee_of_zZ_at_t0,
         g_factor_of_zZ,
         mpdata_settings,
+        nt=None,
     ):
         self.__t = 0
+        self.__step = 0
         self.dt = dt
         self.advector_of_t = advector_of_t
+        self.changed = True
+
+        self.advector_series = None
+        if nt is not None:
+            times = np.cumsum(np.full(2 * nt, 0.5 * dt))[::2]
+            self.advector_series = np.asarray(
+                [advector_of_t(t) for t in times], dtype=float
+            )
+            np.testing.assert_array_less(np.abs(self.advector_series), 1)
 
         grid = (nz,)
         options = Options(
@@ -55,10 +68,29 @@ class MPDATA_1D:
         return self.solver.advector.get_component(0)
 
     def update_advector_field(self):
-        self.__t += 0.5 * self.dt
-        self.advector[:] = self.advector_of_t(self.__t)
-        np.testing.assert_array_less(np.abs(self.advector), 1)
-        self.__t += 0.5 * self.dt
+        """sets the advector for the next step (from the series precomputed for
+        all `nt` steps, if given), `changed` telling if it differs from the last one"""
+        if self.advector_series is None:
+            self.__t += 0.5 * self.dt
+            self.advector[:] = self.advector_of_t(self.__t)
+            if checks_enabled():
+                np.testing.assert_array_less(np.abs(self.advector), 1)
+            self.__t += 0.5 * self.dt
+            return
+        if self.__step == len(self.advector_series):
+            raise ValueError(
+                f"advector series precomputed for nt={len(self.advector_series)}"
+                " steps only (pass a larger nt, or nt=None to evaluate it each step)"
+            )
+        value = self.advector_series[self.__step]
+        self.changed = self.__step == 0 or not np.array_equal(
+            value, self.advector_series[self.__step - 1]
+        )
+        if self.changed:
+            self.advector[:] = value
+        if checks_enabled("paranoid"):
+            np.testing.assert_array_less(np.abs(self.advector), 1)
+        self.__step += 1
 
     def __call__(self):
         self.solver.advance(1)
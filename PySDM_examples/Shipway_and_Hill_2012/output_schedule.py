@@ -0,0 +1,58 @@
+import numpy as np
+from PySDM.physics import si
+
+
+class OutputSchedule:
+    """maps time-step indices (`0...nt`) to output slots of product groups
+    (e.g. `scalar`, `spectrum`, `attributes`), each given either as a list of
+    `steps` (e.g. `range(0, nt + 1, cadence)`) or of (possibly irregular)
+    `times` matched to the nearest step within `tolerance`; the mapping is
+    computed once so that per-step lookups are O(1)"""
+
+    def __init__(self, *, dt: float, nt: int, tolerance: float = 0.1 * si.s):
+        self.dt = dt
+        self.nt = nt
+        self.tolerance = tolerance
+        self._slots = {}
+        self._steps = {}
+
+    def add(self, group: str, *, steps=None, times=None) -> "OutputSchedule":
+        assert (steps is None) != (times is None)
+        slots = np.full(self.nt + 1, -1, dtype=int)
+        if steps is not None:
+            steps = np.asarray(steps, dtype=int)
+            assert ((0 <= steps) & (steps <= self.nt)).all()
+            slots[steps] = np.arange(len(steps))
+        else:
+            distances = np.full(self.nt + 1, np.inf)
+            for slot, time in enumerate(times):
+                first = max(int((time - self.tolerance) // self.dt), 0)
+                last = min(int((time + self.tolerance) // self.dt) + 1, self.nt)
+                for step in range(first, last + 1):
+                    distance = abs(step * self.dt - time)
+                    if distance < self.tolerance and distance < distances[step]:
+                        distances[step] = distance
+                        slots[step] = slot
+            steps = np.full(len(times), -1, dtype=int)
+            for step in np.flatnonzero(slots >= 0)[::-1]:
+                steps[slots[step]] = step
+        self._slots[group] = slots
+        self._steps[group] = steps
+        return self
+
+    def slot(self, group: str, step: int) -> int:
+        """index of the output slot of `group` at `step` (-1 if none)"""
+        return self._slots[group][step]
+
+    def n_slots(self, group: str) -> int:
+        return len(self._steps[group])
+
+    def steps(self, group: str) -> np.ndarray:
+        """(first) step saved in each slot of `group` (-1 if none)"""
+        return self._steps[group]
+
+    def times(self, group: str) -> np.ndarray:
+        """time of each slot of `group` (NaN if none)"""
+        steps = self.steps(group)
+        times = np.linspace(0, self.nt * self.dt, self.nt + 1, endpoint=True)
+        return np.where(steps >= 0, times[steps], np.nan)
@@ -149,6 +149,14 @@ class Settings:
         self.rain_water_radius_range = [50 * si.um, np.inf * si.um]
         self.rain_water_radius_range_igel = [25 * si.um, np.inf * si.um]
         self.save_spec_and_attr_times = save_spec_and_attr_times
+        self.output_attributes = {  # dtypes (None: as in the particulator)
+            "cell origin": None,
+            "position in cell": None,
+            "radius": None,
+            "n": None,
+        }
+        self.output_attributes_path = None  # if set, attributes are memory-mapped
+        self.output_profiles = None  # names of profile products to record (all if None)
 
     @property
     def n_sd(self):
@@ -16,15 +16,23 @@ from PySDM.environments.kinematic_1d import Kinematic1D
 from PySDM.impl.mesh import Mesh
 from PySDM.initialisation.sampling import spatial_sampling, spectral_sampling
 
+from PySDM_examples.Shipway_and_Hill_2012.attribute_recorder import AttributeRecorder
 from PySDM_examples.Shipway_and_Hill_2012.mpdata_1d import MPDATA_1D
+from PySDM_examples.Shipway_and_Hill_2012.output_schedule import OutputSchedule
 
 
 class Simulation:
-    def __init__(self, settings, backend=CPU):
+    def __init__(self, settings, backend=CPU, output_schedule=None):
         self.nt = settings.nt
         self.z0 = -settings.particle_reservoir_depth
         self.save_spec_and_attr_times = settings.save_spec_and_attr_times
         self.number_of_bins = settings.number_of_bins
+        self.output_schedule = output_schedule or (
+            OutputSchedule(dt=settings.dt, nt=settings.nt)
+            .add("scalar", steps=range(settings.nt + 1))
+            .add("spectrum", times=settings.save_spec_and_attr_times)
+            .add("attributes", times=settings.save_spec_and_attr_times)
+        )
 
         self.particulator = None
         self.output_attributes = None
@@ -53,6 +61,7 @@ class Simulation:
             nz=settings.nz,
             dt=settings.dt,
             mpdata_settings=settings.mpdata_settings,
+            nt=settings.nt,
             advector_of_t=lambda t: settings.rho_times_w(t) * settings.dt / settings.dz,
             advectee_of_zZ_at_t0=lambda zZ: settings.qv(zZ_to_z_above_reservoir(zZ)),
             g_factor_of_zZ=lambda zZ: settings.rhod(zZ_to_z_above_reservoir(zZ)),
@@ -63,6 +72,7 @@ class Simulation:
             -_extra_nz, settings.nz - _extra_nz, settings.nz + 1
         )
         self.g_factor_vec = settings.rhod(_z_vec)
+        self.courant_field = (np.empty_like(self.g_factor_vec),)
 
         self.builder.set_environment(self.env)
         self.builder.add_dynamic(AmbientThermodynamics())
@@ -159,20 +169,30 @@ class Simulation:
             attributes=self.attributes, products=self.products
         )
 
-        self.output_attributes = {
-            "cell origin": [],
-            "position in cell": [],
-            "radius": [],
-            "n": [],
-        }
+        self.output_attributes = AttributeRecorder(
+            self.particulator,
+            attributes=settings.output_attributes,
+            n_snapshots=self.output_schedule.n_slots("attributes"),
+            path=settings.output_attributes_path,
+        )
         self.output_products = {}
         for k, v in self.particulator.products.items():
             if len(v.shape) == 1:
-                self.output_products[k] = np.zeros((self.mesh.grid[-1], self.nt + 1))
+                if (
+                    settings.output_profiles is not None
+                    and k not in settings.output_profiles
+                ):
+                    continue
+                self.output_products[k] = np.zeros(
+                    (self.mesh.grid[-1], self.output_schedule.n_slots("scalar"))
+                )
             elif len(v.shape) == 2:
-                number_of_time_sections = len(self.save_spec_and_attr_times)
                 self.output_products[k] = np.zeros(
-                    (self.mesh.grid[-1], self.number_of_bins, number_of_time_sections)
+                    (
+                        self.mesh.grid[-1],
+                        self.number_of_bins,
+                        self.output_schedule.n_slots("spectrum"),
+                    )
                 )
 
     @staticmethod
@@ -184,49 +204,36 @@ class Simulation:
             )
         )
 
-    def save_scalar(self, step):
+    def save_scalar(self, index):
         for k, v in self.particulator.products.items():
-            if len(v.shape) > 1:
+            if len(v.shape) > 1 or k not in self.output_products:
                 continue
-            self.output_products[k][:, step] = v.get()
+            self.output_products[k][:, index] = v.get()
 
     def save_spectrum(self, index):
         for k, v in self.particulator.products.items():
             if len(v.shape) == 2:
                 self.output_products[k][:, :, index] = v.get()
 
-    def save_attributes(self):
-        for k, v in self.output_attributes.items():
-            v.append(self.particulator.attributes[k].to_ndarray())
+    def save_attributes(self, index):
+        self.output_attributes.record(self.particulator, index)
 
     def save(self, step):
-        self.save_scalar(step)
-        time = step * self.particulator.dt
-        if len(self.save_spec_and_attr_times) > 0 and (
-            np.min(
-                np.abs(
-                    np.ones_like(self.save_spec_and_attr_times) * time
-                    - np.array(self.save_spec_and_attr_times)
-                )
-            )
-            < 0.1
-        ):
-            save_index = np.argmin(
-                np.abs(
-                    np.ones_like(self.save_spec_and_attr_times) * time
-                    - np.array(self.save_spec_and_attr_times)
-                )
-            )
-            self.save_spectrum(save_index)
-            self.save_attributes()
+        index = self.output_schedule.slot("scalar", step)
+        if index >= 0:
+            self.save_scalar(index)
+        index = self.output_schedule.slot("spectrum", step)
+        if index >= 0:
+            self.save_spectrum(index)
+        index = self.output_schedule.slot("attributes", step)
+        if index >= 0:
+            self.save_attributes(index)
 
     def run(self):
         mesh = self.particulator.mesh
 
         assert "t" not in self.output_products and "z" not in self.output_products
-        self.output_products["t"] = np.linspace(
-            0, self.nt * self.particulator.dt, self.nt + 1, endpoint=True
-        )
+        self.output_products["t"] = self.output_schedule.times("scalar")
         self.output_products["z"] = np.linspace(
             self.z0 + mesh.dz / 2,
             self.z0 + (mesh.grid[-1] - 1 / 2) * mesh.dz,
@@ -237,12 +244,16 @@ class Simulation:
         self.save(0)
         for step in range(self.nt):
             self.mpdata.update_advector_field()
-            if "Displacement" in self.particulator.dynamics:
+            if "Displacement" in self.particulator.dynamics and self.mpdata.changed:
+                np.divide(
+                    self.mpdata.advector, self.g_factor_vec, out=self.courant_field[0]
+                )
                 self.particulator.dynamics["Displacement"].upload_courant_field(
-                    (self.mpdata.advector / self.g_factor_vec,)
+                    self.courant_field
                 )
             self.particulator.run(steps=1)
             self.save(step + 1)
+        self.output_attributes.flush()
 
         Outputs = namedtuple("Outputs", "products attributes")
         output_results = Outputs(self.output_products, self.output_attributes)
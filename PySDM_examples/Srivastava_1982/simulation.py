@@ -5,6 +5,7 @@ from PySDM.environments import Box
 from PySDM.products import SuperDropletCountPerGridbox, VolumeFirstMoment, ZerothMoment
 
 from PySDM_examples.Srivastava_1982.settings import SimProducts
+from PySDM_examples.utils.validation import checks_enabled
 
 
 class Simulation:
@@ -63,12 +64,13 @@ class Simulation:
                             step
                         ] = particulator.products[prod].get()
 
-                np.testing.assert_allclose(
-                    actual=self.simulation_res[n_sd][
-                        SimProducts.PySDM.total_volume.name
-                    ][seed],
-                    desired=self.settings.total_volume,
-                    rtol=1e-3,
-                )
+                if checks_enabled():
+                    np.testing.assert_allclose(
+                        actual=self.simulation_res[n_sd][
+                            SimProducts.PySDM.total_volume.name
+                        ][seed],
+                        desired=self.settings.total_volume,
+                        rtol=1e-3,
+                    )
 
         return self.simulation_res
@@ -1,5 +1,14 @@
 # pylint: disable=invalid-name
+from .checkpoint import Checkpoint
+from .ensemble import Ensemble
 from .gui_settings import GUISettings
+from .memory_storage import MemoryStorage
 from .mpdata_2d import MPDATA_2D
+from .netcdf_sink import NetCDFSink
+from .profiler import Profiler
 from .simulation import Simulation
+from .spin_up_cache import SpinUpCache
 from .storage import Storage
+from .subscriptions import Subscriptions
+from .sweep import Sweep
+from .write_behind import WriteBehind
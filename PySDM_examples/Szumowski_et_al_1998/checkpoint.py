@@ -0,0 +1,177 @@
+import json
+import os
+
+import numpy as np
+
+
+def _random_generators(obj, prefix, depth=2):
+    for attr, value in sorted(vars(obj).items()):
+        if attr == "particulator":
+            continue
+        if isinstance(getattr(value, "generator", None), np.random.Generator):
+            yield f"{prefix}.{attr}", value.generator
+        elif depth > 1 and hasattr(value, "__dict__") and not isinstance(value, type):
+            yield from _random_generators(value, f"{prefix}.{attr}", depth - 1)
+
+
+def _observer_storages(particulator) -> dict:
+    """per-particle state kept by observers, e.g., the previous temperature
+    held by the `cooling rate` attribute"""
+    return {
+        f"{type(observer).__name__}.prev_T": observer.prev_T
+        for observer in particulator.observers
+        if hasattr(observer, "prev_T")
+    }
+
+
+def random_generators(particulator) -> dict:
+    """the random number generators held by the dynamics (CPU backend only),
+    keyed by their location, e.g. `Collision.rnd_opt_coll.rnd`"""
+    generators = {}
+    for key, dynamic in particulator.dynamics.items():
+        generators.update(_random_generators(dynamic, key))
+    return generators
+
+
+def state_arrays(simulation, step: int) -> dict:
+    """arrays (and JSON metadata under "metadata") describing the state of
+    the `simulation` at the output `step`"""
+    particulator = simulation.particulator
+    arrays = {}
+    # raw (unpermuted) attribute arrays and the permutation (which holds
+    # the number of super droplets left) are stored separately since
+    # some backend routines depend on the memory layout
+    for key in simulation.attribute_keys:
+        arrays[f"attributes/{key}"] = particulator.attributes[key].to_ndarray(raw=True)
+    idx = particulator.attributes["n"].idx
+    arrays["index/idx"] = idx.to_ndarray()[: len(idx)]
+    for key, storage in _observer_storages(particulator).items():
+        arrays[f"observers/{key}"] = storage.to_ndarray()
+    for key in particulator.environment.variables:
+        arrays[f"environment/{key}"] = particulator.environment[key].to_ndarray()
+    for key, dynamic in particulator.dynamics.items():
+        for name, counter in getattr(dynamic, "counters", {}).items():
+            arrays[f"counters/{key}/{name}"] = counter.to_ndarray()
+
+    t = None
+    if "EulerianAdvection" in particulator.dynamics:
+        solvers = particulator.dynamics["EulerianAdvection"].solvers
+        solvers.wait()
+        for key, mpdata in solvers.mpdatas.items():
+            arrays[f"advectees/{key}"] = mpdata.advectee.get().copy()
+        t = solvers.t
+
+    metadata = {
+        "step": int(step),
+        "n_steps": particulator.n_steps,
+        "t": t,
+        "random": {
+            key: generator.bit_generator.state
+            for key, generator in random_generators(particulator).items()
+        },
+    }
+    arrays["metadata"] = np.array(json.dumps(metadata))
+    return arrays
+
+
+def write(path, arrays: dict):
+    """writes `arrays` into a single `.npz` file replaced atomically (with
+    the containing directory synced afterwards, except on Windows, so that
+    the rename itself persists)"""
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as file:
+        np.savez(file, **arrays)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, path)
+    if os.name != "nt":
+        directory = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+
+
+def read(path) -> dict:
+    """returns a dict with the metadata (under "metadata") and arrays keyed
+    by their group, e.g. `state["attributes"]["n"]`"""
+    state = {}
+    with np.load(path) as file:
+        for key in file.files:
+            if key == "metadata":
+                state[key] = json.loads(str(file[key]))
+                continue
+            group, name = key.split("/", 1)
+            state.setdefault(group, {})[name] = file[key]
+    return state
+
+
+class Checkpoint:
+    """state of a `Simulation` at an output step written every `interval` output
+    steps into a single `.npz` file (replaced atomically) holding super-droplet
+    attributes, MPDATA advectees, ambient thermodynamic fields and dynamics'
+    counters as binary arrays, plus JSON metadata with the step counter, the
+    MPDATA clock, the storage position and the states of the random number
+    generators; resume with `Simulation.reinit(resume=True)` (with output
+    written to a `Storage`, the only sink able to reopen an interrupted run)"""
+
+    class Exception(BaseException):
+        pass
+
+    def __init__(self, path, interval: int = 1):
+        self.path = str(path)
+        self.interval = interval
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def save(self, simulation, step: int):
+        write(self.path, state_arrays(simulation, step))
+
+    def load(self) -> dict:
+        if not self.exists():
+            raise Checkpoint.Exception()
+        return read(self.path)
+
+    @staticmethod
+    def restore(simulation, state: dict, strict: bool = True):
+        """applies the state (except for attributes, which are passed to
+        the builder) to a freshly built particulator of the `simulation`;
+        unless `strict`, the set of random number generators may differ
+        (only those present in both are restored)"""
+        particulator = simulation.particulator
+        metadata = state["metadata"]
+        n_sd = len(state["attributes"]["n"])
+        idx = np.full(n_sd, n_sd)  # removed super droplets are flagged with n_sd
+        idx[: len(state["index"]["idx"])] = state["index"]["idx"]
+        particulator.attributes["n"].idx.upload(idx)
+        particulator.attributes.healthy = False
+        particulator.attributes.sanitize()
+        for key, array in state.get("observers", {}).items():
+            _observer_storages(particulator)[key].upload(array)
+
+        particulator.n_steps = metadata["n_steps"]
+        for key, array in state.get("environment", {}).items():
+            particulator.environment[key].upload(array)
+        for key, array in state.get("counters", {}).items():
+            dynamic, name = key.split("/", 1)
+            particulator.dynamics[dynamic].counters[name].upload(array)
+
+        if "advectees" in state:
+            solvers = particulator.dynamics["EulerianAdvection"].solvers
+            for key, array in state["advectees"].items():
+                solvers.mpdatas[key].advectee.get()[:] = array
+            solvers.t = metadata["t"]
+            solvers.refresh_advector()
+
+        generators = random_generators(particulator)
+        if strict and generators.keys() != metadata["random"].keys():
+            raise Checkpoint.Exception()
+        for key, generator in generators.items():
+            if key in metadata["random"]:
+                generator.bit_generator.state = metadata["random"][key]
+
+        # products accumulating between outputs (e.g., timestep extrema) are reset
+        # upon fetching, as they were when storing the checkpointed step
+        for product in particulator.products.values():
+            product.get()
@@ -0,0 +1,135 @@
+import os
+from concurrent.futures import as_completed
+
+import numpy as np
+
+from PySDM_examples.Szumowski_et_al_1998.memory_storage import MemoryStorage
+from PySDM_examples.Szumowski_et_al_1998.simulation import Simulation
+from PySDM_examples.Szumowski_et_al_1998.storage import Storage
+from PySDM_examples.utils import process_pool
+
+
+class RunningStatistics:
+    """Welford's online algorithm for the mean and (unbiased) variance"""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = None
+        self._m2 = None
+
+    def update(self, value):
+        value = np.asarray(value, dtype=float)
+        if self.mean is None:
+            self.mean = np.zeros_like(value)
+            self._m2 = np.zeros_like(value)
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+    @property
+    def variance(self):
+        if self.count < 2:
+            return np.full_like(self.mean, np.nan)
+        return self._m2 / (self.count - 1)
+
+
+def run_member(settings_factory, SpinUp, seed, path):
+    """runs a single member (in a worker process) returning a list of
+    `(name, step, data)` outputs, with `step=None` for scalar series"""
+    settings = settings_factory(seed)
+    storage = MemoryStorage() if path is None else Storage(path=path)
+    simulation = Simulation(settings, storage, SpinUp)
+    simulation.reinit()
+    simulation.run()
+
+    outputs = []
+    for name in simulation.products:
+        try:
+            outputs.append((name, None, np.array(storage.load(name))))
+        except Storage.Exception:
+            for step in settings.output_steps:
+                outputs.append((name, step, np.array(storage.load(name, step))))
+    return outputs
+
+
+class Ensemble:
+    """runs `n_members` realisations of `Simulation` with settings built by
+    `settings_factory(seed)` (a picklable callable) in a pool of `n_processes`
+    worker processes; each member gets a seed spawned from `seed` (so that
+    their random number streams are independent) and ensemble mean and
+    variance of each product at each output step are updated as members
+    complete (outputs of each member being released once accounted for); if
+    `path` is given, these are saved into `Storage`s under `path/mean` and
+    `path/variance`, and (if `keep_members`) member outputs are stored under
+    `path/member_<index>`"""
+
+    def __init__(
+        self,
+        settings_factory,
+        n_members: int,
+        seed=None,
+        SpinUp=None,
+        n_processes=None,
+        path=None,
+        keep_members=False,
+    ):
+        assert path is not None or not keep_members
+        seed_sequence = np.random.SeedSequence(seed)
+        self.entropy = seed_sequence.entropy
+        self.seeds = [
+            int(child.generate_state(1)[0]) for child in seed_sequence.spawn(n_members)
+        ]
+        self.settings_factory = settings_factory
+        self.SpinUp = SpinUp
+        self.n_processes = n_processes
+        self.path = path
+        self.keep_members = keep_members
+        self.statistics = {}
+
+    def member_path(self, member: int):
+        if not self.keep_members:
+            return None
+        return os.path.join(self.path, f"member_{member:03d}")
+
+    def run(self):
+        self.statistics = {}
+        with process_pool(self.n_processes) as executor:
+            futures = {
+                executor.submit(
+                    run_member,
+                    self.settings_factory,
+                    self.SpinUp,
+                    seed,
+                    self.member_path(member),
+                )
+                for member, seed in enumerate(self.seeds)
+            }
+            for future in as_completed(futures):
+                futures.remove(future)
+                for name, step, data in future.result():
+                    if (name, step) not in self.statistics:
+                        self.statistics[(name, step)] = RunningStatistics()
+                    self.statistics[(name, step)].update(data)
+        if self.path is not None:
+            self.save()
+
+    def mean(self, name: str, step: int = None) -> np.ndarray:
+        return self.statistics[(name, step)].mean
+
+    def variance(self, name: str, step: int = None) -> np.ndarray:
+        return self.statistics[(name, step)].variance
+
+    def save(self):
+        settings = self.settings_factory(self.seeds[0])
+        for statistic in ("mean", "variance"):
+            storage = Storage(path=os.path.join(self.path, statistic))
+            storage.init(settings)
+            for (name, step), statistics in self.statistics.items():
+                data = getattr(statistics, statistic)
+                if step is not None:
+                    storage.save(data, step, name)
+                    continue
+                for value, output_step in zip(data, settings.output_steps):
+                    storage.save(float(value), output_step, name)
+            storage.flush()
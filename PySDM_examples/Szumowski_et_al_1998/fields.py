@@ -1,6 +1,8 @@
 import numpy as np
 from PySDM.impl.arakawa_c import z_scalar_coord
 
+from PySDM_examples.utils.validation import checks_enabled
+
 
 def z_vec_coord(grid):
     nx = grid[0]
@@ -9,13 +11,15 @@ def z_vec_coord(grid):
         np.repeat(np.linspace(1 / 2, grid[0] - 1 / 2, nx).reshape((nx, 1)), nz, axis=1)
         / grid[0]
     )
-    assert np.amin(xX) >= 0
-    assert np.amax(xX) <= 1
-    assert xX.shape == (nx, nz)
+    if checks_enabled():
+        assert np.amin(xX) >= 0
+        assert np.amax(xX) <= 1
+        assert xX.shape == (nx, nz)
     zZ = np.repeat(np.linspace(0, grid[1], nz).reshape((1, nz)), nx, axis=0) / grid[1]
-    assert np.amin(zZ) == 0
-    assert np.amax(zZ) == 1
-    assert zZ.shape == (nx, nz)
+    if checks_enabled():
+        assert np.amin(zZ) == 0
+        assert np.amax(zZ) == 1
+        assert zZ.shape == (nx, nz)
     return xX, zZ
 
 
@@ -23,13 +27,15 @@ def x_vec_coord(grid):
     nx = grid[0] + 1
     nz = grid[1]
     xX = np.repeat(np.linspace(0, grid[0], nx).reshape((nx, 1)), nz, axis=1) / grid[0]
-    assert np.amin(xX) == 0
-    assert np.amax(xX) == 1
-    assert xX.shape == (nx, nz)
+    if checks_enabled():
+        assert np.amin(xX) == 0
+        assert np.amax(xX) == 1
+        assert xX.shape == (nx, nz)
     zZ = np.repeat(z_scalar_coord(grid).reshape((1, nz)), nx, axis=0) / grid[1]
-    assert np.amin(zZ) >= 0
-    assert np.amax(zZ) <= 1
-    assert zZ.shape == (nx, nz)
+    if checks_enabled():
+        assert np.amin(zZ) >= 0
+        assert np.amax(zZ) <= 1
+        assert zZ.shape == (nx, nz)
     return xX, zZ
 
 
@@ -54,3 +60,81 @@ def nondivergent_vector_field_2d(
 
     rho_times_courant = [rho_velocity_x * dt / dx, rho_velocity_z * dt / dz]
     return rho_times_courant
+
+
+class NondivergentVectorField2D:
+    """precomputed counterpart of `nondivergent_vector_field_2d()` for repeated
+    evaluation: staggered coordinates are computed once and the result is
+    written into reusable buffers (hence valid until the next call); with
+    `period` given, advectors are tabulated for one period of `t` sampled
+    every `dt/2`; Courant numbers are checked every `check_every` calls
+    (0 disables the check; overridden by the validation level, see
+    `PySDM_examples.utils.validation`)"""
+
+    def __init__(
+        self,
+        grid: tuple,
+        size: tuple,
+        dt: float,
+        stream_function: callable,
+        period: float = None,
+        check_every: int = 1,
+    ):
+        self.stream_function = stream_function
+        self.check_every = check_every
+        self.n_calls = 0
+
+        dx = size[0] / grid[0]
+        dz = size[1] / grid[1]
+        dxX = 1 / grid[0]
+        dzZ = 1 / grid[1]
+
+        xX, zZ = x_vec_coord(grid)
+        self._coords_x = ((xX, zZ + dzZ / 2), (xX, zZ - dzZ / 2))
+        xX, zZ = z_vec_coord(grid)
+        self._coords_z = ((xX + dxX / 2, zZ), (xX - dxX / 2, zZ))
+        self._factors = (-dt / dx / dz, dt / dx / dz)
+        self.advector = [
+            np.empty(self._coords_x[0][0].shape),
+            np.empty(self._coords_z[0][0].shape),
+        ]
+
+        self.table = None
+        self.half_dt = dt / 2
+        if period is not None:
+            n_entries = period / self.half_dt
+            if n_entries < 1 or not np.isclose(n_entries, round(n_entries)):
+                raise ValueError("period must be a multiple of dt/2")
+            self.table = []
+            for index in range(round(n_entries)):
+                self._evaluate(index * self.half_dt)
+                self._check()
+                self.table.append([component.copy() for component in self.advector])
+
+    def _evaluate(self, t):
+        for (plus, minus), factor, out in zip(
+            (self._coords_x, self._coords_z), self._factors, self.advector
+        ):
+            np.subtract(
+                self.stream_function(*plus, t),
+                self.stream_function(*minus, t),
+                out=out,
+            )
+            out *= factor
+
+    def _check(self):
+        for component in self.advector:
+            np.testing.assert_array_less(np.abs(component), 1)
+
+    def __call__(self, t) -> list:
+        if self.table is not None:
+            index = round(t / self.half_dt) % len(self.table)
+            return self.table[index]
+        self._evaluate(t)
+        check_every = self.check_every if checks_enabled() else 0
+        if checks_enabled("paranoid"):
+            check_every = 1
+        if check_every and self.n_calls % check_every == 0:
+            self._check()
+        self.n_calls += 1
+        return self.advector
@@ -0,0 +1,90 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+import numpy as np
+
+
+class FrameCache:
+    """wraps a `Storage` with a least-recently-used cache of loaded field frames
+    bounded by `max_bytes`, and with a single-thread prefetcher loading frames
+    ahead of playback (stale prefetch requests are dropped once a newer one
+    arrives, and frames loaded before `clear()` are not inserted after it);
+    scalar series (loaded with `step=None`) are never cached as they grow while
+    the simulation runs"""
+
+    def __init__(self, storage, max_bytes=256 * 1024**2, n_prefetch=4):
+        self.storage = storage
+        self.max_bytes = max_bytes
+        self.n_prefetch = n_prefetch
+        self._frames = OrderedDict()
+        self._n_bytes = 0
+        self._lock = Lock()
+        self._generation = 0
+        self._epoch = 0  # incremented on clear()
+        self._executor = None
+
+    def __getattr__(self, item):
+        return getattr(self.storage, item)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._epoch += 1
+            self._frames.clear()
+            self._n_bytes = 0
+
+    def _lookup(self, key):
+        with self._lock:
+            if key not in self._frames:
+                return None
+            self._frames.move_to_end(key)
+            return self._frames[key]
+
+    def _insert(self, key, data, epoch):
+        if data.nbytes > self.max_bytes:
+            return
+        with self._lock:
+            if epoch != self._epoch or key in self._frames:
+                return
+            self._frames[key] = data
+            self._n_bytes += data.nbytes
+            while self._n_bytes > self.max_bytes:
+                _, evicted = self._frames.popitem(last=False)
+                self._n_bytes -= evicted.nbytes
+
+    def load(self, name: str, step: int = None, level: int = 1) -> np.ndarray:
+        if step is None:
+            return self.storage.load(name)
+        key = (name, step, level)
+        data = self._lookup(key)
+        if data is None:
+            epoch = self._epoch
+            data = np.array(self.storage.load(name, step, level))
+            data.flags.writeable = False
+            self._insert(key, data, epoch)
+        return data
+
+    def _prefetch(self, generation, keys):
+        for key in keys:
+            if generation != self._generation:
+                return
+            if self._lookup(key) is None:
+                try:
+                    self.load(*key)
+                except self.storage.Exception:
+                    pass
+
+    def prefetch(self, products, steps):
+        """schedules background loading of the given products (name -> pyramid
+        level) at the given steps (in order), superseding any previously
+        scheduled prefetch"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+        keys = tuple(
+            (name, step, level) for step in steps for name, level in products.items()
+        )
+        self._executor.submit(self._prefetch, generation, keys)
@@ -2,23 +2,33 @@ import os
 import sys
 
 from open_atmos_jupyter_utils import TemporaryFile
-from PySDM.exporters import NetCDFExporter
 
 from PySDM_examples.Szumowski_et_al_1998.gui_controller import GUIController
 from PySDM_examples.Szumowski_et_al_1998.gui_viewer import GUIViewer
+from PySDM_examples.Szumowski_et_al_1998.netcdf_sink import NetCDFSink
 from PySDM_examples.utils.widgets import HTML, Tab, VBox, display
 
 
-def launch(settings, simulation, storage):
-    ncdf_file = TemporaryFile(".nc")
-    ncdf_exporter = NetCDFExporter(
-        storage, settings, simulation, ncdf_file.absolute_path
-    )
+def launch(settings, simulation, storage, subscriptions=None, netcdf=True):
+    """note that `simulation.storage` is replaced: with `netcdf`, by a `NetCDFSink`
+    writing to a temporary file (offered for download) and forwarding to `storage`,
+    otherwise by `storage` itself; with `subscriptions`, only the products displayed
+    are evaluated (others being NaN in the netCDF file)"""
+    if netcdf:
+        ncdf_file = TemporaryFile(".nc")
+        simulation.storage = NetCDFSink(
+            settings, simulation, ncdf_file.absolute_path, storage=storage
+        )
+    else:
+        ncdf_file = None
+        simulation.storage = storage
 
     vtk_file = TemporaryFile(".zip")
 
-    viewer = GUIViewer(storage, settings)
-    controller = GUIController(simulation, viewer, ncdf_exporter, ncdf_file, vtk_file)
+    if subscriptions is not None:
+        simulation.subscriptions = subscriptions
+    viewer = GUIViewer(storage, settings, subscriptions)
+    controller = GUIController(simulation, viewer, ncdf_file, vtk_file)
 
     controller_box = controller.box()
 
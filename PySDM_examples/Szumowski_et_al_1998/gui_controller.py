@@ -9,7 +9,7 @@ from PySDM_examples.utils.widgets import Button, Checkbox, FloatProgress, HBox
 
 
 class GUIController:
-    def __init__(self, simulator, viewer, ncdf_exporter, ncdf_file, vtk_file):
+    def __init__(self, simulator, viewer, ncdf_file, vtk_file):
         self.progress = FloatProgress(value=0.0, min=0.0, max=1.0)
         self.button = Button()
         self.link = HBox()
@@ -19,7 +19,6 @@ class GUIController:
         self.panic = False
         self.thread = None
         self.simulator = simulator
-        self.ncdf_exporter = ncdf_exporter
         self.ncdf_file = ncdf_file
         self.vtk_file = vtk_file
         self.tempdir = None
@@ -52,7 +51,7 @@ class GUIController:
         netcdf_box = Checkbox(
             description="netCDF output",
             disabled=True,
-            value=True,
+            value=self.ncdf_file is not None,
             indent=False,
             layout={"width": "125px"},
         )
@@ -103,30 +102,26 @@ class GUIController:
         self.thread = Thread(target=self.simulator.run, args=(self, self.vtk_exporter))
 
         self.simulator.reinit()
+        self.viewer.reinit(self.simulator.products)  # subscribes displayed products
         self.thread.start()
         self.progress.description = "running"
-        self.viewer.reinit(self.simulator.products)
 
     def _handle_save(self, _):
         def task(controller):
-            controller.progress.value = 0
-            if self.checkbox.value:
-                self.vtk_exporter.write_pvd()
-                controller.progress.description = "VTK..."
-                shutil.make_archive(
-                    self.vtk_file.absolute_path[:-4], "zip", self.vtk_exporter.path
+            with controller:
+                if self.checkbox.value:
+                    self.vtk_exporter.write_pvd()
+                    controller.progress.description = "VTK..."
+                    shutil.make_archive(
+                        self.vtk_file.absolute_path[:-4], "zip", self.vtk_exporter.path
+                    )
+                files = (self.ncdf_file,) if self.ncdf_file is not None else ()
+                if self.checkbox.value:
+                    files += (self.vtk_file,)
+                controller.link.children = tuple(
+                    file.make_link_widget() for file in files
                 )
-            controller.progress.description = "netCDF..."
-            self.ncdf_exporter.run(controller)
-            controller.link.children = (
-                (self.ncdf_file.make_link_widget(),)
-                if not self.checkbox.value
-                else (
-                    self.ncdf_file.make_link_widget(),
-                    self.vtk_file.make_link_widget(),
-                )
-            )
 
+        self._setup_stop()
         self.thread = Thread(target=task, args=(self,))
         self.thread.start()
-        self._setup_stop()
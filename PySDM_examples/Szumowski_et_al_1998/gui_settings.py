@@ -23,6 +23,7 @@ class GUISettings:
 
     def __init__(self, settings):
         self.__settings = settings
+        self.seed = None
 
         self.ui_dth0 = FloatSlider(
             description="$\\Delta\\theta_0$ [K]", value=0, min=-15, max=15
@@ -197,7 +198,15 @@ class GUISettings:
         self.breakup_efficiency = settings.breakup_efficiency
         self.breakup_fragmentation = settings.breakup_fragmentation
 
-        for attr in ("rhod_of_zZ", "versions", "n_spin_up"):
+        for attr in (
+            "rhod_of_zZ",
+            "versions",
+            "n_spin_up",
+            "mpdata_asynchronous",
+            "mpdata_n_threads",
+            "mpdata_stream_function_period",
+            "mpdata_courant_check_every",
+        ):
             setattr(self, attr, getattr(settings, attr))
 
     @property
@@ -234,7 +243,8 @@ class GUISettings:
     def formulae(self) -> Formulae:
         return Formulae(
             **{widget.description: widget.value for widget in self.ui_formulae_options},
-            constants={"NIEMAND_A": 0, "NIEMAND_B": 0, "ABIFM_M": 0, "ABIFM_C": 0}
+            seed=self.seed,
+            constants={"NIEMAND_A": 0, "NIEMAND_B": 0, "ABIFM_M": 0, "ABIFM_C": 0},
         )
 
     @property
@@ -350,6 +360,20 @@ class GUISettings:
             )
         raise NotImplementedError()
 
+    def widget(self, name: str):
+        """widget by name, e.g. `dth0` (`ui_dth0`), `freezing.model` (item of
+        `ui_freezing`) or `processes.coalescence` (by description)"""
+        group, _, item = name.partition(".")
+        widgets = getattr(self, f"ui_{group}")
+        if not item:
+            return widgets
+        if isinstance(widgets, dict):
+            return widgets[item]
+        for widget in widgets:
+            if widget.description == item:
+                return widget
+        raise KeyError(name)
+
     def box(self):
         layout = Accordion(
             children=[
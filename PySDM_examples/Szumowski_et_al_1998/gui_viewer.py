@@ -5,6 +5,7 @@ from matplotlib import pyplot, rcParams
 from open_atmos_jupyter_utils import save_and_make_link
 from PySDM.physics import constants as const
 
+from PySDM_examples.Szumowski_et_al_1998.frame_cache import FrameCache
 from PySDM_examples.Szumowski_et_al_1998.plots import (
     _ImagePlot,
     _SpectrumPlot,
@@ -30,9 +31,20 @@ from PySDM_examples.utils.widgets import (
 
 
 class GUIViewer:
-    def __init__(self, storage, settings):
-        self.storage = storage
+    spectrum_products = {
+        "size": ("Particles Wet Size Spectrum", "Particles Dry Size Spectrum"),
+        "terminal velocity": ("radius binned number averaged terminal velocity",),
+        "temperature": (
+            "particle specific concentration",
+            "freezable specific concentration",
+        ),
+    }
+
+    def __init__(self, storage, settings, subscriptions=None):
+        self.storage = FrameCache(storage)
         self.settings = settings
+        self.subscriptions = subscriptions
+        self.last_step = 0
 
         self.play = Play(interval=1000)
         self.step_slider = IntSlider(continuous_update=False, description="t/dt_out:")
@@ -68,6 +80,8 @@ class GUIViewer:
 
     def reinit(self, products):
         self.products = products
+        self.storage.clear()
+        self.last_step = 0
         self.product_select.options = tuple(
             (f"{val.name} [{val.unit}]", key)
             for key, val in sorted(self.products.items(), key=lambda item: item[1].name)
@@ -192,7 +206,21 @@ class GUIViewer:
     def handle_save_spe(self, _):
         display(save_and_make_link(self.spectrumPlots[self.spectrum_select.value].fig))
 
+    def subscribe(self):
+        """declares the displayed products as needed (if `subscriptions` given)"""
+        if self.subscriptions is None:
+            return
+        self.subscriptions.subscribe(
+            self,
+            names=(
+                self.product_select.value,
+                *self.spectrum_products.get(self.spectrum_select.value, ()),
+                "surf_precip",
+            ),
+        )
+
     def replot(self, *_):
+        self.subscribe()
         selectedImage = self.product_select.value
         if not (selectedImage is None or selectedImage not in self.plots):
             self.replot_image()
@@ -212,6 +240,33 @@ class GUIViewer:
         with self.timeseriesOutput:
             display(self.timeseriesPlot.fig)
 
+        self.prefetch()
+
+    def prefetch(self):
+        step = self.step_slider.value
+        direction = -1 if step < self.last_step else 1
+        self.last_step = step
+
+        products = {
+            name: 1
+            for name in self.spectrum_products.get(self.spectrum_select.value, ())
+        }
+        if self.product_select.value in self.plots:
+            plot = self.plots[self.product_select.value]
+            products[self.product_select.value] = self.storage.pyramid_level(
+                plot.display_shape()
+            )
+        steps = [
+            self.settings.output_steps[index]
+            for index in range(
+                step + direction,
+                step + direction * (self.storage.n_prefetch + 1),
+                direction,
+            )
+            if 0 <= index < len(self.settings.output_steps)
+        ]
+        self.storage.prefetch(products, steps)
+
     def update_spectra(self):
         selected = self.spectrum_select.value
         self.spectrum_box.children = [self.spectrumOutputs[selected]]
@@ -223,7 +278,7 @@ class GUIViewer:
         yrange = slice(*self.slider["Z"].value)
 
         if selected == "size":
-            for key in ("Particles Wet Size Spectrum", "Particles Dry Size Spectrum"):
+            for key in self.spectrum_products["size"]:
                 if xrange.start == xrange.stop or yrange.start == yrange.stop:
                     continue
                 try:
@@ -309,13 +364,25 @@ class GUIViewer:
             self.plot_box.children = [self.outputs[selected]]
 
         step = self.step_slider.value
+        plot = self.plots[selected]
         try:
-            data = self.storage.load(selected, self.settings.output_steps[step])
+            stats = self.storage.statistics(selected, self.settings.output_steps[step])
+            if stats["nan_count"] == plot.nans.size:
+                data = plot.nans
+            else:
+                data = self.storage.load(
+                    selected,
+                    self.settings.output_steps[step],
+                    self.storage.pyramid_level(plot.display_shape()),
+                )
         except self.storage.Exception:
-            data = None
+            data, stats = None, None
 
-        self.plots[selected].update(
-            data, step, self.storage.data_range(selected) if data is not None else None
+        plot.update(
+            data,
+            step,
+            self.storage.data_range(selected) if data is not None else None,
+            stats,
         )
 
     def replot_image(self, *_):
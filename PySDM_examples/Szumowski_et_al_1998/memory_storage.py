@@ -0,0 +1,149 @@
+import numpy as np
+
+from PySDM_examples.Szumowski_et_al_1998.storage import (
+    Storage,
+    statistics_dtype,
+    update_statistics,
+)
+
+
+class MemoryStorage:
+    """in-memory counterpart of `Storage` (same `init/save/load/data_range`
+    interface) keeping each field product in an array preallocated for all
+    output steps or, if `keep_last` is set, in a ring buffer retaining only the
+    last `keep_last` steps (scalar series are always kept in full); products
+    which would push the allocated memory above `max_bytes` are spilled to an
+    on-disk `Storage` (at `spill_path` or in a temporary directory); fields are
+    loaded as read-only views of the buffers"""
+
+    Exception = Storage.Exception
+
+    def __init__(
+        self,
+        dtype=np.float32,
+        keep_last=None,
+        max_bytes=None,
+        spill_path=None,
+        n_hist_bins=16,
+    ):
+        assert keep_last is None or keep_last > 0
+        self.dtype = dtype
+        self.keep_last = keep_last
+        self.max_bytes = max_bytes
+        self.spill_path = spill_path
+        self.stats_dtype = statistics_dtype(n_hist_bins)
+        self.n_bytes = 0
+        self.settings = None
+        self.spill = None
+        self._step_index = None
+        self._fields = {}
+        self._slots = {}
+        self._series = {}
+        self._lengths = {}
+        self._spilled = set()
+        self._data_range = None
+
+    def init(self, settings):
+        self.settings = settings
+        self.n_bytes = 0
+        self._step_index = {
+            step: index for index, step in enumerate(settings.output_steps)
+        }
+        self._fields = {}
+        self._slots = {}
+        self._series = {}
+        self._lengths = {}
+        self._spilled = set()
+        self._data_range = {}
+        if self.spill is not None:
+            self.spill.init(settings)
+
+    def _fits(self, n_bytes):
+        return self.max_bytes is None or self.n_bytes + n_bytes <= self.max_bytes
+
+    def save(self, data: (float, np.ndarray), step: int, name: str):
+        if name in self._spilled:
+            self.spill.save(data, step, name)
+            return
+
+        index = self._step_index[step]
+        if isinstance(data, (int, float)):
+            if name not in self._series:
+                self._series[name] = np.empty(len(self._step_index), self.dtype)
+                self.n_bytes += self._series[name].nbytes
+            if step == 0 or name not in self._lengths:
+                self._lengths[name] = 0
+            self._series[name][self._lengths[name]] = data
+            self._lengths[name] += 1
+        elif data.shape[0:2] == self.settings.grid:
+            if name not in self._fields:
+                n_slots = min(self.keep_last or np.inf, len(self._step_index))
+                n_bytes = n_slots * data.size * np.dtype(self.dtype).itemsize
+                if not self._fits(n_bytes):
+                    if self.spill is None:
+                        self.spill = Storage(dtype=self.dtype, path=self.spill_path)
+                        self.spill.init(self.settings)
+                    self._spilled.add(name)
+                    self.spill.save(data, step, name)
+                    return
+                self._fields[name] = np.empty((n_slots, *data.shape), self.dtype)
+                self._slots[name] = np.full(n_slots, -1)
+                self.n_bytes += n_bytes
+            slot = index % len(self._slots[name])
+            self._fields[name][slot] = data
+            self._slots[name][slot] = index
+        else:
+            raise NotImplementedError()
+
+        if name not in self._data_range:
+            self._data_range[name] = (np.inf, -np.inf)
+        if not np.isnan(data).all():
+            self._data_range[name] = (
+                min(np.nanmin(data), self._data_range[name][0]),
+                max(np.nanmax(data), self._data_range[name][1]),
+            )
+
+    def data_range(self, name):
+        if name in self._spilled:
+            return self.spill.data_range(name)
+        return self._data_range[name]
+
+    def flush(self):
+        if self.spill is not None:
+            self.spill.flush()
+
+    @staticmethod
+    def pyramid_level(_):
+        return 1
+
+    def load(self, name: str, step: int = None, level: int = 1) -> np.ndarray:
+        if level != 1:
+            raise MemoryStorage.Exception()
+        if name in self._series and step is None:
+            return self._series[name][: self._lengths[name]].copy()
+        if name in self._fields and step in self._step_index:
+            index = self._step_index[step]
+            slot = index % len(self._slots[name])
+            if self._slots[name][slot] == index:
+                frame = self._fields[name][slot].view()
+                frame.flags.writeable = False  # the slot is reused by later steps
+                return frame
+        if name in self._spilled:
+            return self.spill.load(name, step)
+        raise MemoryStorage.Exception()
+
+    def statistics(self, name: str, step: int = None) -> np.ndarray:
+        if name in self._spilled:
+            return self.spill.statistics(name, step)
+        if step is not None:
+            record = np.empty(1, dtype=self.stats_dtype)[0]
+            update_statistics(record, self.load(name, step))
+            return record
+        stats = np.zeros(len(self._step_index), dtype=self.stats_dtype)
+        stats["nan_count"] = -1
+        for index, step_ in enumerate(self._step_index):
+            try:
+                update_statistics(stats[index], self.load(name, step_))
+            except MemoryStorage.Exception:
+                pass
+        return stats
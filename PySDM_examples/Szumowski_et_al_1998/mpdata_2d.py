@@ -8,13 +8,26 @@ from PySDM.backends.impl_numba import conf
 from PySDM.impl.arakawa_c import make_rhod
 
 from PySDM_examples.Szumowski_et_al_1998.fields import (
-    nondivergent_vector_field_2d,
+    NondivergentVectorField2D,
     x_vec_coord,
     z_vec_coord,
 )
 
 
 class MPDATA_2D:
+    """with `asynchronous=True`, the advection of each timestep is carried out
+    in a background thread (overlapping with particle dynamics) and joined in
+    `wait()` called from the environment sync at the beginning of the next step;
+    the advector (and the Courant field passed to `displacement`) is refreshed
+    synchronously beforehand, and the PyMPDATA stepper is then compiled
+    single-threaded to avoid nesting Numba parallel regions across threads
+    (hence requesting `n_threads` other than one raises a `ValueError`);
+    `stream_function_period` and `courant_check_every` are passed to
+    `NondivergentVectorField2D` (tabulation of periodic forcings and frequency
+    of Courant-number checks, respectively); `n_threads` sets the number of
+    threads of the PyMPDATA stepper, each advancing a slab of the x-dimension
+    (defaults to the size of the Numba thread pool)"""
+
     def __init__(
         self,
         *,
@@ -28,7 +41,11 @@ class MPDATA_2D:
         n_iters=2,
         infinite_gauge=True,
         nonoscillatory=True,
-        third_order_terms=False
+        third_order_terms=False,
+        asynchronous=False,
+        stream_function_period=None,
+        courant_check_every=1,
+        n_threads=None,
     ):
         self.grid = grid
         self.size = size
@@ -37,10 +54,21 @@ class MPDATA_2D:
         self.stream_function_time_dependent = (
             "t" in inspect.signature(stream_function).parameters
         )
-        self.asynchronous = False
+        self.asynchronous = asynchronous
         self.thread: (Thread, None) = None
+        self._error = None
         self.displacement = displacement
         self.t = 0
+        self.advector = NondivergentVectorField2D(
+            grid,
+            size,
+            dt,
+            stream_function,
+            period=stream_function_period
+            if self.stream_function_time_dependent
+            else None,
+            check_every=courant_check_every,
+        )
 
         options = Options(
             n_iters=n_iters,
@@ -48,15 +76,19 @@ class MPDATA_2D:
             nonoscillatory=nonoscillatory,
             third_order_terms=third_order_terms,
         )
-        disable_threads_if_needed = {}
-        if not conf.JIT_FLAGS["parallel"]:
-            disable_threads_if_needed["n_threads"] = 1
+        if asynchronous and n_threads not in (None, 1):
+            raise ValueError(
+                f"n_threads={n_threads} requested with asynchronous=True"
+                " (the asynchronous stepper is single-threaded)"
+            )
+        if asynchronous or not conf.JIT_FLAGS["parallel"]:
+            n_threads = 1
 
         stepper = Stepper(
             options=options,
             grid=self.grid,
             non_unit_g_factor=True,
-            **disable_threads_if_needed
+            **({} if n_threads is None else {"n_threads": n_threads}),
         )
 
         advector_impl = VectorField(
@@ -79,6 +111,7 @@ class MPDATA_2D:
             rhod_of_zZ(zZ=x_vec_coord(self.grid)[-1]),
             rhod_of_zZ(zZ=z_vec_coord(self.grid)[-1]),
         )
+        self.courant = [np.empty_like(g_factor) for g_factor in self.g_factor_vec]
         self.mpdatas = {}
         for k, v in advectees.items():
             advectee_impl = ScalarField(
@@ -98,7 +131,9 @@ class MPDATA_2D:
 
     def __call__(self):
         if self.asynchronous:
-            self.thread = Thread(target=self.step, args=())
+            self.wait()
+            self._prepare()
+            self.thread = Thread(target=self._advance_catching, args=(), daemon=True)
             self.thread.start()
         else:
             self.step()
@@ -107,28 +142,41 @@ class MPDATA_2D:
         if self.asynchronous:
             if self.thread is not None:
                 self.thread.join()
+                self.thread = None
+            if self._error is not None:
+                error, self._error = self._error, None
+                raise error
+
+    def _advance_catching(self):
+        try:
+            self._advance()
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            self._error = error
 
     def refresh_advector(self):
         for mpdata in self.mpdatas.values():
-            advector = nondivergent_vector_field_2d(
-                self.grid, self.size, self.dt, self.stream_function, t=self.t
-            )
+            advector = self.advector(self.t)
             for d in range(len(self.grid)):
-                np.testing.assert_array_less(np.abs(advector[d]), 1)
                 mpdata.advector.get_component(d)[:] = advector[d]
             if self.displacement is not None:
                 for d in range(len(self.grid)):
-                    advector[d] /= self.g_factor_vec[d]
-                self.displacement.upload_courant_field(advector)
+                    np.divide(advector[d], self.g_factor_vec[d], out=self.courant[d])
+                self.displacement.upload_courant_field(self.courant)
             break  # the advector field is shared
 
-    def step(self):
+    def _prepare(self):
         if not self.stream_function_time_dependent and self.t == 0:
             self.refresh_advector()
 
         self.t += 0.5 * self.dt
         if self.stream_function_time_dependent:
             self.refresh_advector()
+        self.t += 0.5 * self.dt
+
+    def _advance(self):
         for mpdata in self.mpdatas.values():
             mpdata.advance(1)
-        self.t += 0.5 * self.dt
+
+    def step(self):
+        self._prepare()
+        self._advance()
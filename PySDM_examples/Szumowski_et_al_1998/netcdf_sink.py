@@ -0,0 +1,104 @@
+import numpy as np
+from PySDM.exporters import NetCDFExporter
+from PySDM.exporters.netcdf_exporter import DIM_SUFFIX
+from PySDM.products.impl.spectrum_moment_product import SpectrumMomentProduct
+from scipy.io import netcdf_file
+
+from PySDM_examples.Szumowski_et_al_1998.storage import Storage
+
+
+class NetCDFSink(NetCDFExporter):
+    """`Storage`-compatible sink collecting output steps in an open netCDF file
+    (same layout as `NetCDFExporter` output, but with `T` as the unlimited record
+    dimension) as the simulation runs; `scipy.io.netcdf_file` keeps the records
+    in memory, and the file is written to disk once, on `flush()` which
+    `Simulation.run()` calls at the end; products not saved at a given step
+    (e.g., not subscribed to, see `Subscriptions`) are NaN-filled; if a `storage`
+    is passed, all calls are forwarded to it as well (so that, e.g., `GUIViewer`
+    can read from it)"""
+
+    Exception = Storage.Exception
+
+    def __init__(self, settings, simulator, filename, storage=None):
+        super().__init__(storage, settings, simulator, filename)
+        self.ncdf = None
+        self._step_index = None
+        self._step = None
+        self._saved = set()
+
+    def _create_dimensions(self, ncdf):
+        ncdf.createDimension("T", None)
+
+        for index, label in enumerate(self.XZ):
+            ncdf.createDimension(label, self.settings.grid[index])
+
+        for name, instance in self.simulator.products.items():
+            if isinstance(instance, SpectrumMomentProduct):
+                ncdf.createDimension(
+                    f"{name}{DIM_SUFFIX}", len(instance.attr_bins_edges) - 1
+                )
+
+    def init(self, settings):
+        self.close()
+        self.settings = settings
+        if self.storage is not None:
+            self.storage.init(settings)
+        self._step_index = {
+            step: index for index, step in enumerate(settings.output_steps)
+        }
+        self._step = None
+        self._saved = set()
+        self.ncdf = netcdf_file(self.filename, mode="w")
+        self._write_settings(self.ncdf)
+        self._create_dimensions(self.ncdf)
+        self._create_variables(self.ncdf)
+
+    def save(self, data, step: int, name: str):
+        if self.storage is not None:
+            self.storage.save(data, step, name)
+        if self._step is not None and step != self._step:
+            self._fill()
+        self._step = step
+        index = self._step_index[step]
+        self.vars["T"][index] = step * self.settings.dt
+        self.vars[name][index] = data
+        self._saved.add(name)
+
+    def _fill(self):
+        index = self._step_index[self._step]
+        for name in self.simulator.products:
+            if name not in self._saved:
+                self.vars[name][index] = np.nan
+        self._saved.clear()
+
+    def flush(self):
+        if self.storage is not None:
+            self.storage.flush()
+        self.close()
+
+    def close(self):
+        if self.ncdf is not None:
+            if self._step is not None:
+                self._fill()
+            self.ncdf.close()
+            self.ncdf = None
+
+    def load(self, name: str, step: int = None, level: int = 1):
+        if self.storage is None:
+            raise NetCDFSink.Exception()
+        return self.storage.load(name, step, level)
+
+    def pyramid_level(self, max_shape: tuple):
+        if self.storage is None:
+            raise NetCDFSink.Exception()
+        return self.storage.pyramid_level(max_shape)
+
+    def data_range(self, name):
+        if self.storage is None:
+            raise NetCDFSink.Exception()
+        return self.storage.data_range(name)
+
+    def statistics(self, name: str, step: int = None):
+        if self.storage is None:
+            raise NetCDFSink.Exception()
+        return self.storage.statistics(name, step)
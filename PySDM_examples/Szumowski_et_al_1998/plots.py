@@ -53,7 +53,12 @@ class _ImagePlot(_Plot):
             return data.T
         return None
 
-    def update(self, data, step, data_range):
+    def display_shape(self):
+        """number of pixels spanned by the axes in X and Z"""
+        extent = self.ax.get_window_extent()
+        return int(extent.width), int(extent.height)
+
+    def update(self, data, step, data_range, stats=None):
         data = self._transpose(data)
         if data is not None:
             self.im.set_data(data)
@@ -61,7 +66,10 @@ class _ImagePlot(_Plot):
                 self.im.set_clim(vmin=data_range[0], vmax=data_range[1])
             nanmin = np.nan
             nanmax = np.nan
-            if np.isfinite(data).any():
+            if stats is not None:
+                nanmin = stats["min"]
+                nanmax = stats["max"]
+            elif np.isfinite(data).any():
                 nanmin = np.nanmin(data)
                 nanmax = np.nanmax(data)
             self.ax.set_title(
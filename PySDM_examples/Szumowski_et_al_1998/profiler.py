@@ -0,0 +1,160 @@
+import time
+import tracemalloc
+
+from PySDM.products.impl.product import Product
+
+# with Python < 3.9 (no `tracemalloc.reset_peak()`), the net change of traced
+# memory is recorded instead of the peak
+_RESET_PEAK = hasattr(tracemalloc, "reset_peak")
+
+
+class Probe:
+    """drop-in replacement for PySDM's `WallTimer` (which `Particulator.run()`
+    enters around each call to a dynamic) additionally counting calls and,
+    if memory is traced, the peak of bytes allocated within the call (the net
+    change if the peak cannot be reset, i.e. with Python < 3.9)"""
+
+    def __init__(self, trace_memory: bool):
+        self.trace_memory = trace_memory
+        self.time = None  # duration of the last call (as in `WallTimer`)
+        self.calls = 0
+        self.total_time = 0.0
+        self.total_allocated = 0
+        self.period_time = 0.0
+        self.period_allocated = 0
+        self._memory = 0
+
+    def __enter__(self):
+        if self.trace_memory:
+            if _RESET_PEAK:
+                tracemalloc.reset_peak()
+            self._memory = tracemalloc.get_traced_memory()[0]
+        self.time = time.perf_counter()
+
+    def __exit__(self, *_):
+        self.time = time.perf_counter() - self.time
+        self.calls += 1
+        self.total_time += self.time
+        self.period_time += self.time
+        if self.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            allocated = max((peak if _RESET_PEAK else current) - self._memory, 0)
+            self.total_allocated += allocated
+            self.period_allocated += allocated
+
+
+class _ProfiledWallTime(Product):
+    def __init__(self, probes: dict, name, unit="s"):
+        super().__init__(name=name, unit=unit)
+        self.probes = probes
+
+    def register(self, builder):
+        super().register(builder)
+        self.shape = ()
+
+    def _impl(self, **kwargs):
+        result = 0.0
+        for probe in self.probes.values():
+            result += probe.period_time
+            probe.period_time = 0.0
+        return result
+
+
+class _ProfiledAllocation(Product):
+    def __init__(self, probes: dict, name, unit="dimensionless"):
+        super().__init__(name=name, unit=unit)
+        self.probes = probes
+
+    def register(self, builder):
+        super().register(builder)
+        self.shape = ()
+
+    def _impl(self, **kwargs):
+        result = 0
+        for probe in self.probes.values():
+            result += probe.period_allocated
+            probe.period_allocated = 0
+        return result
+
+
+class Profiler:
+    """records wall time, call counts and (with `trace_memory`, using `tracemalloc`)
+    bytes allocated by each dynamic (through probes replacing `particulator.timers`)
+    and by each product evaluation in `Simulation.store()`; `products()` returns
+    scalar products (`<dynamic> wall time`, `<dynamic> allocated bytes` and the
+    same for product evaluation as a whole) holding values accumulated since the
+    previous output, and `summary()` a table of totals (written to `path`, if
+    given, at the end of `Simulation.run()`); note that with asynchronous MPDATA
+    advection the time spent waiting for it is attributed to the dynamic that
+    triggers the environment sync"""
+
+    PRODUCTS = "product evaluation"
+
+    def __init__(self, trace_memory: bool = False, path=None):
+        self.trace_memory = trace_memory
+        self.path = path
+        self.dynamics = {}
+        self.products_evaluated = {}
+        self.n_steps = 0
+
+    def products(self, dynamics) -> list:
+        """products to be registered along with the `dynamics` (keys)"""
+        self.dynamics = {key: Probe(self.trace_memory) for key in dynamics}
+        self.products_evaluated = {}
+        products = []
+        for key, group in (
+            *((key, {key: probe}) for key, probe in self.dynamics.items()),
+            (self.PRODUCTS, self.products_evaluated),
+        ):
+            products.append(_ProfiledWallTime(group, name=f"{key} wall time"))
+            if self.trace_memory:
+                products.append(
+                    _ProfiledAllocation(group, name=f"{key} allocated bytes")
+                )
+        return products
+
+    def attach(self, particulator):
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self.n_steps = 0
+        for key in particulator.dynamics:
+            if key not in self.dynamics:
+                self.dynamics[key] = Probe(self.trace_memory)
+            particulator.timers[key] = self.dynamics[key]
+        particulator.observers.append(self)
+
+    def notify(self):
+        self.n_steps += 1
+
+    def product(self, name: str) -> Probe:
+        """probe to be entered around evaluation of the product `name`"""
+        if name not in self.products_evaluated:
+            self.products_evaluated[name] = Probe(self.trace_memory)
+        return self.products_evaluated[name]
+
+    def summary(self) -> str:
+        lines = [
+            f"{'':60} {'calls':>8} {'time [s]':>10} {'per call [ms]':>13}"
+            + (f" {'allocated [MiB]':>15}" if self.trace_memory else ""),
+        ]
+        for group, probes in (
+            ("dynamic", self.dynamics),
+            ("product", self.products_evaluated),
+        ):
+            for key, probe in sorted(
+                probes.items(), key=lambda item: -item[1].total_time
+            ):
+                line = (
+                    f"{group + ': ' + key:60} {probe.calls:8d} {probe.total_time:10.3f}"
+                    f" {1e3 * probe.total_time / max(probe.calls, 1):13.3f}"
+                )
+                if self.trace_memory:
+                    line += f" {probe.total_allocated / 2**20:15.3f}"
+                lines.append(line)
+        lines.append(f"{self.n_steps} steps")
+        return "\n".join(lines)
+
+    def write_summary(self):
+        if self.path is not None:
+            with open(self.path, "w", encoding="utf-8") as file:
+                file.write(self.summary() + "\n")
@@ -13,29 +13,82 @@ from PySDM.dynamics import (
 from PySDM.environments import Kinematic2D
 from PySDM.initialisation.sampling import spatial_sampling
 
+from PySDM_examples.Szumowski_et_al_1998.checkpoint import Checkpoint
 from PySDM_examples.Szumowski_et_al_1998.make_default_product_collection import (
     make_default_product_collection,
 )
 from PySDM_examples.Szumowski_et_al_1998.mpdata_2d import MPDATA_2D
-from PySDM_examples.utils import DummyController
+from PySDM_examples.Szumowski_et_al_1998.profiler import Probe
+from PySDM_examples.Szumowski_et_al_1998.spin_up_cache import spin_up_step
+from PySDM_examples.utils import DummyController, split_population
 
 
 class Simulation:
-    def __init__(self, settings, storage, SpinUp, backend_class=CPU):
+    def __init__(
+        self,
+        settings,
+        storage,
+        SpinUp,
+        backend_class=CPU,
+        checkpoint=None,
+        spin_up_cache=None,
+        subscriptions=None,
+        profiler=None,
+    ):
         self.settings = settings
         self.storage = storage
         self.particulator = None
         self.backend_class = backend_class
         self.SpinUp = SpinUp
+        self.checkpoint = checkpoint
+        self.attribute_keys = ()
+        self.resume_step = None
+        self.spin_up_cache = spin_up_cache
+        self.spin_up_key = None
+        self.spin_up_outputs = None
+        self.subscriptions = subscriptions
+        self.product_timing = {}
+        self.profiler = profiler
 
     @property
     def products(self):
         return self.particulator.products
 
-    def reinit(self, products=None):
+    def reinit(self, products=None, resume=False):
+        if resume and self.storage is not None and not hasattr(self.storage, "resume"):
+            raise ValueError(
+                f"{type(self.storage).__name__} cannot resume an interrupted run"
+            )
+        state = self.checkpoint.load() if resume else None
+        self.resume_step = None
+        self.spin_up_key = None
+        self.spin_up_outputs = None
+        self.product_timing = {}
+
+        if products is not None:
+            products = list(products)
+        else:
+            products = make_default_product_collection(self.settings)
+
+        if (
+            state is None
+            and self.spin_up_cache is not None
+            and self.SpinUp is not None
+            and spin_up_step(self.settings) > 0
+        ):
+            self.spin_up_key = self.spin_up_cache.key(
+                self.settings, products, self.backend_class
+            )
+            state = self.spin_up_cache.load(self.spin_up_key)
+            if state is None:
+                self.spin_up_outputs = {}
+
         formulae = self.settings.formulae
         backend = self.backend_class(formulae=formulae)
-        builder = Builder(n_sd=self.settings.n_sd, backend=backend)
+        builder = Builder(
+            n_sd=self.settings.n_sd if state is None else len(state["attributes"]["n"]),
+            backend=backend,
+        )
         environment = Kinematic2D(
             dt=self.settings.dt,
             grid=self.settings.grid,
@@ -45,11 +98,6 @@ class Simulation:
         )
         builder.set_environment(environment)
 
-        if products is not None:
-            products = list(products)
-        else:
-            products = make_default_product_collection(self.settings)
-
         if self.settings.processes["fluid advection"]:
             builder.add_dynamic(AmbientThermodynamics())
         if self.settings.processes["condensation"]:
@@ -93,6 +141,10 @@ class Simulation:
                 infinite_gauge=self.settings.mpdata_iga,
                 nonoscillatory=self.settings.mpdata_fct,
                 third_order_terms=self.settings.mpdata_tot,
+                asynchronous=self.settings.mpdata_asynchronous,
+                stream_function_period=self.settings.mpdata_stream_function_period,
+                courant_check_every=self.settings.mpdata_courant_check_every,
+                n_threads=self.settings.mpdata_n_threads,
             )
             builder.add_dynamic(EulerianAdvection(solver))
         if self.settings.processes["particle advection"]:
@@ -148,20 +200,24 @@ class Simulation:
         )
 
         if self.settings.processes["freezing"]:
+            # a stream independent of those seeded with formulae.seed in PySDM
+            rng = np.random.default_rng(
+                np.random.SeedSequence(formulae.seed).spawn(1)[0]
+            )
             if self.settings.freezing_inp_spec is None:
                 immersed_surface_area = formulae.trivia.sphere_surface(
                     diameter=2 * formulae.trivia.radius(volume=attributes["dry volume"])
                 )
             else:
                 immersed_surface_area = self.settings.freezing_inp_spec.percentiles(
-                    np.random.random(attributes["dry volume"].size),  # TODO #599: seed
+                    rng.random(attributes["dry volume"].size),
                 )
 
             if self.settings.freezing_singular:
                 attributes[
                     "freezing temperature"
                 ] = formulae.freezing_temperature_spectrum.invcdf(
-                    np.random.random(immersed_surface_area.size),  # TODO #599: seed
+                    rng.random(immersed_surface_area.size),
                     immersed_surface_area,
                 )
             else:
@@ -174,45 +230,53 @@ class Simulation:
                     True: "freezing temperature",
                     False: "immersed surface area",
                 }[self.settings.freezing_singular]
-                for name, array in attributes.items():
-                    if array.shape[-1] != self.settings.n_sd // 2:
-                        raise AssertionError(f"attribute >>{name}<< has wrong size")
-                    array = array.copy()
-                    full_shape = list(array.shape)
-                    orig = slice(None, full_shape[-1])
-                    copy = slice(orig.stop, None)
-                    full_shape[-1] *= 2
-                    attributes[name] = np.empty(full_shape, dtype=array.dtype)
-                    if name == freezing_attribute:
-                        attributes[name][orig] = array
-                        attributes[name][copy] = 0
-                    elif name == "n":
-                        attributes[name][orig] = array * self.settings.freezing_inp_frac
-                        attributes[name][copy] = array * (
-                            1 - self.settings.freezing_inp_frac
-                        )
-                    elif len(array.shape) > 1:
-                        attributes[name][:, orig] = array
-                        attributes[name][:, copy] = array
-                    else:
-                        attributes[name][orig] = array
-                        attributes[name][copy] = array
+                attributes = split_population(
+                    attributes,
+                    fractions=(
+                        self.settings.freezing_inp_frac,
+                        1 - self.settings.freezing_inp_frac,
+                    ),
+                    fill={freezing_attribute: (None, 0)},
+                )
 
                 non_zero_per_gridbox = np.count_nonzero(
                     attributes[freezing_attribute]
                 ) / np.prod(self.settings.grid)
                 assert non_zero_per_gridbox == self.settings.n_sd_per_gridbox / 2
 
+        if state is not None:
+            attributes = state["attributes"]
+        self.attribute_keys = tuple(attributes)
+        if self.profiler is not None:
+            products += self.profiler.products(builder.particulator.dynamics)
         self.particulator = builder.build(attributes, tuple(products))
+        if self.profiler is not None:
+            self.profiler.attach(self.particulator)
+            self.product_timing = self.profiler.products_evaluated
+        if state is not None:
+            # generators absent from a cached spin-up state belong to
+            # dynamics disabled during spin-up (thus not drawn from)
+            Checkpoint.restore(self, state, strict=resume)
+            self.resume_step = state["metadata"]["step"]
 
         if self.SpinUp is not None:
             self.SpinUp(self.particulator, self.settings.n_spin_up)
         if self.storage is not None:
-            self.storage.init(self.settings)
+            if resume:
+                self.storage.resume(self.settings, self.resume_step)
+            else:
+                self.storage.init(self.settings)
+                for step, outputs in (state or {}).get("outputs", {}).items():
+                    for name, data in outputs.items():
+                        self.storage.save(data, step, name)
 
     def run(self, controller=DummyController(), vtk_exporter=None):
+        if vtk_exporter is not None and self.subscriptions is not None:
+            self.subscriptions.subscribe(vtk_exporter)  # exports all products
         with controller:
-            for step in self.settings.output_steps:
+            for index, step in enumerate(self.settings.output_steps):
+                if self.resume_step is not None and step <= self.resume_step:
+                    continue
                 if controller.panic:
                     break
 
@@ -224,8 +288,53 @@ class Simulation:
                     vtk_exporter.export_attributes(self.particulator)
                     vtk_exporter.export_products(self.particulator)
 
+                if (
+                    self.checkpoint is not None
+                    and index % self.checkpoint.interval == 0
+                ):
+                    self.checkpoint.save(self, step)
+
                 controller.set_percent(step / self.settings.output_steps[-1])
 
+            if "EulerianAdvection" in self.particulator.dynamics:
+                self.particulator.dynamics["EulerianAdvection"].solvers.wait()
+            self.storage.flush()
+            if self.profiler is not None:
+                self.profiler.write_summary()
+
     def store(self, step):
+        index = step // self.settings.steps_per_output_interval
         for name, product in self.particulator.products.items():
-            self.storage.save(product.get(), step, name)
+            if not (
+                self.subscriptions is None
+                or self.spin_up_outputs is not None  # cached outputs are complete
+                or self.subscriptions.is_due(name, index)
+            ):
+                if len(product.shape) == 0:  # keeping series aligned with output steps
+                    self.storage.save(np.nan, step, name)
+                continue
+            with self._product_probe(name):
+                data = product.get()
+            self.storage.save(data, step, name)
+            if self.spin_up_outputs is not None:
+                self.spin_up_outputs.setdefault(step, {})[name] = np.array(data)
+        if self.spin_up_outputs is not None and step == spin_up_step(self.settings):
+            self.spin_up_cache.save(self, self.spin_up_key, self.spin_up_outputs)
+            self.spin_up_outputs = None
+
+    def _product_probe(self, name: str) -> Probe:
+        if self.profiler is not None:
+            return self.profiler.product(name)
+        if name not in self.product_timing:
+            self.product_timing[name] = Probe(trace_memory=False)
+        return self.product_timing[name]
+
+    def product_report(self) -> str:
+        """number of evaluations and total evaluation time of each product
+        (most expensive first)"""
+        lines = [f"{'product':48} {'count':>6} {'time [s]':>9}"]
+        for name, probe in sorted(
+            self.product_timing.items(), key=lambda item: -item[1].total_time
+        ):
+            lines.append(f"{name:48} {probe.calls:6d} {probe.total_time:9.3f}")
+        return "\n".join(lines)
@@ -0,0 +1,189 @@
+import glob
+import hashlib
+import os
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+from PySDM_examples.Szumowski_et_al_1998.checkpoint import read, state_arrays, write
+
+# settings which take effect during spin-up (collisions, sedimentation and thawing
+# are disabled until then, so their parameters are not listed); only these (and
+# not, e.g., the widgets of `GUISettings`) are hashed into the cache key together
+# with the formulae options and constants (except for the per-process default
+# random seed)
+SPIN_UP_SETTINGS = (
+    "grid",
+    "size",
+    "dt",
+    "n_spin_up",
+    "output_interval",
+    "n_sd_per_gridbox",
+    "spectrum_per_mass_of_dry_air",
+    "kappa",
+    "rhod_w_max",
+    "initial_dry_potential_temperature_profile",
+    "initial_vapour_mixing_ratio_profile",
+    "condensation_rtol_x",
+    "condensation_rtol_thd",
+    "condensation_adaptive",
+    "condensation_substeps",
+    "condensation_dt_cond_range",
+    "condensation_schedule",
+    "displacement_adaptive",
+    "displacement_rtol",
+    "freezing_singular",
+    "freezing_inp_spec",
+    "freezing_inp_frac",
+    "mpdata_iters",
+    "mpdata_iga",
+    "mpdata_fct",
+    "mpdata_tot",
+    "mpdata_stream_function_period",
+    "aerosol_radius_threshold",
+    "drizzle_radius_threshold",
+    "r_bins_edges",
+    "T_bins_edges",
+    "terminal_velocity_radius_bin_edges",
+    "versions",
+)
+POST_SPIN_UP_PROCESSES = ("coalescence", "breakup", "sedimentation")
+
+
+def _canonical(value, depth=4) -> str:
+    if isinstance(value, np.ndarray):
+        checksum = hashlib.sha256(np.ascontiguousarray(value).tobytes()).hexdigest()
+        value = f"ndarray({value.dtype},{value.shape},{checksum})"
+    elif isinstance(value, SimpleNamespace) and hasattr(value, "__name__"):
+        value = value.__name__  # formulae components
+    elif callable(value) and hasattr(value, "__qualname__"):
+        value = f"{value.__module__}.{value.__qualname__}"
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return repr(value)
+    if isinstance(value, (tuple, list)):
+        return "(" + ",".join(_canonical(item, depth) for item in value) + ")"
+    if isinstance(value, dict):
+        return (
+            "{"
+            + ",".join(
+                f"{key!r}:{_canonical(item, depth)}"
+                for key, item in sorted(value.items(), key=lambda item: repr(item[0]))
+            )
+            + "}"
+        )
+    name = f"{type(value).__module__}.{type(value).__qualname__}"
+    if depth == 0 or not hasattr(value, "__dict__"):
+        return name
+    return name + _canonical(vars(value), depth - 1)
+
+
+def digest(values) -> str:
+    """SHA-256 of a canonical representation of `values` (nested containers,
+    arrays, scalars and objects, the latter represented by their attributes)"""
+    return hashlib.sha256(_canonical(values).encode()).hexdigest()
+
+
+def spin_up_step(settings) -> int:
+    """the last output step not past the end of spin-up (the cached state)"""
+    return int(settings.output_steps[settings.output_steps <= settings.n_spin_up][-1])
+
+
+class SpinUpCache:
+    """on-disk cache (one `.npz` file per entry in the `path` directory) of
+    `Simulation` states at the end of spin-up together with the products
+    output during spin-up, keyed by a hash of the settings which affect
+    spin-up; entries not used for more than `max_age` seconds are removed
+    and least recently used ones are removed until the cache fits in
+    `max_size` bytes"""
+
+    def __init__(self, path, max_size=None, max_age=None):
+        self.path = str(path)
+        self.max_size = max_size
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.path, exist_ok=True)
+
+    @staticmethod
+    def key(settings, products, backend_class) -> str:
+        values = {attr: getattr(settings, attr) for attr in SPIN_UP_SETTINGS}
+        values["rhod"] = settings.rhod_of_zZ(
+            np.linspace(0, 1, settings.grid[-1] + 1, endpoint=True)
+        )
+        values["formulae"] = {
+            option: getattr(component, "__name__", component)
+            for option, component in vars(settings.formulae).items()
+            if option not in ("constants", "trivia")
+        }
+        values["constants"] = {
+            name: constant
+            for name, constant in settings.formulae.constants._asdict().items()
+            if name != "default_random_seed"
+        }
+        values["processes"] = {
+            process: enabled
+            for process, enabled in settings.processes.items()
+            if process not in POST_SPIN_UP_PROCESSES
+        }
+        values["backend"] = backend_class.__name__
+        values["products"] = [
+            (type(product).__name__, product.name) for product in products
+        ]
+        return digest(values)
+
+    def _file(self, key):
+        return os.path.join(self.path, f"{key}.npz")
+
+    def entries(self) -> list:
+        return glob.glob(os.path.join(self.path, "*.npz"))
+
+    def size(self) -> int:
+        return sum(os.path.getsize(file) for file in self.entries())
+
+    def load(self, key):
+        """returns the cached state (with spin-up outputs under "outputs"
+        keyed by step and product name) or None"""
+        file = self._file(key)
+        if not os.path.exists(file):
+            self.misses += 1
+            return None
+        self.hits += 1
+        os.utime(file)
+        state = read(file)
+        outputs = {}
+        for key_in_group, array in state.pop("outputs", {}).items():
+            step, name = key_in_group.split("/", 1)
+            outputs.setdefault(int(step), {})[name] = (
+                array.item() if array.ndim == 0 else array
+            )
+        state["outputs"] = dict(sorted(outputs.items()))
+        return state
+
+    def save(self, simulation, key, outputs: dict):
+        arrays = state_arrays(simulation, spin_up_step(simulation.settings))
+        for step, data in outputs.items():
+            for name, array in data.items():
+                arrays[f"outputs/{step}/{name}"] = array
+        write(self._file(key), arrays)
+        self.evict()
+
+    def evict(self):
+        entries = sorted(self.entries(), key=os.path.getmtime)
+        if self.max_age is not None:
+            now = time.time()
+            for file in list(entries):
+                if now - os.path.getmtime(file) > self.max_age:
+                    os.remove(file)
+                    entries.remove(file)
+        if self.max_size is not None:
+            size = sum(os.path.getsize(file) for file in entries)
+            while entries and size > self.max_size:
+                size -= os.path.getsize(entries[0])
+                os.remove(entries.pop(0))
+
+    def report(self) -> str:
+        return (
+            f"spin-up cache: {self.hits} hit(s), {self.misses} miss(es),"
+            f" {len(self.entries())} entries ({self.size()} bytes) in {self.path}"
+        )
@@ -1,29 +1,137 @@
 import os
+import re
 import tempfile
 from pathlib import Path
 
+import numba
 import numpy as np
+from PySDM.backends.impl_numba import conf
+
+from PySDM_examples.Szumowski_et_al_1998 import storage_codecs
+
+
+@numba.njit(**{**conf.JIT_FLAGS, "parallel": False, "fastmath": False})
+def _statistics(data, histogram):
+    n_nan = 0
+    total = 0.0
+    data_min = np.inf
+    data_max = -np.inf
+    for value in data:
+        if not np.isfinite(value):
+            n_nan += 1
+        else:
+            total += value
+            data_min = min(data_min, value)
+            data_max = max(data_max, value)
+    histogram[:] = 0
+    if n_nan == data.size:
+        return np.nan, np.nan, np.nan, n_nan
+    width = (data_max - data_min) / histogram.size
+    for value in data:
+        if np.isfinite(value):
+            index = int((value - data_min) / width) if width > 0 else 0
+            histogram[max(0, min(index, histogram.size - 1))] += 1
+    return data_min, data_max, total / (data.size - n_nan), n_nan
+
+
+def coarsen(data: np.ndarray, factor: int) -> np.ndarray:
+    """NaN-aware means over blocks of `factor` x `factor` cells in the first two
+    dimensions (blocks at the upper edges cover the remaining cells only)"""
+    padding = [(0, -n % factor) for n in data.shape[:2]] + [(0, 0)] * (data.ndim - 2)
+    padded = np.pad(data.astype(float), padding, constant_values=np.nan)
+    blocks = padded.reshape(
+        (padded.shape[0] // factor, factor, padded.shape[1] // factor, factor)
+        + padded.shape[2:]
+    )
+    finite = np.logical_not(np.isnan(blocks))
+    counts = np.sum(finite, axis=(1, 3))
+    sums = np.sum(np.where(finite, blocks, 0), axis=(1, 3))
+    with np.errstate(invalid="ignore"):
+        return np.where(counts > 0, sums / counts, np.nan)
+
+
+def statistics_dtype(n_hist_bins):
+    return np.dtype(
+        [
+            ("min", np.float64),
+            ("max", np.float64),
+            ("mean", np.float64),
+            ("nan_count", np.int64),
+            ("histogram", np.int64, (n_hist_bins,)),
+        ]
+    )
+
+
+def update_statistics(record, data: np.ndarray):
+    (
+        record["min"],
+        record["max"],
+        record["mean"],
+        record["nan_count"],
+    ) = _statistics(np.ravel(data), record["histogram"])
 
 
 class Storage:
+    """by default, writes one `.npy` file per product per output step;
+    with `memmap=True`, each field product is instead kept in a single
+    memory-mapped `(n_output_steps, *shape)` array preallocated on first save,
+    with steps written in place and served by `load()` as zero-copy views
+    (`load(name)` returning a read-only view of the whole array, in which
+    rows of steps not saved are undefined, cf. `statistics()`);
+    scalar products are appended to per-product binary logs (fixed-size header
+    holding the dtype followed by raw values) at a constant cost per step;
+    for each field product, a `<name>.stats.npy` sidecar index keeps per-step
+    min, max, mean and a coarse histogram spanning [min, max] of finite values
+    as well as the count of non-finite ones (`nan_count`, covering also ±inf);
+    field products listed in `codecs` (name -> `storage_codecs.Codec`) are
+    written as `.npz` files holding the encoded frame and the codec spec;
+    for each factor in `pyramid_levels`, a coarsened preview of each field
+    (see `coarsen()`) is saved alongside and served by `load(..., level=factor)`"""
+
     class Exception(BaseException):
         pass
 
-    def __init__(self, dtype=np.float32, path=None):
+    LOG_MAGIC = b"SDM-LOG "
+    LOG_HEADER_SIZE = 16
+    STEP_FILE_PATTERN = re.compile(r"^.*_(\d{6})\.(npy|npz)$")
+
+    def __init__(
+        self,
+        dtype=np.float32,
+        path=None,
+        memmap=False,
+        n_hist_bins=16,
+        codecs=None,
+        pyramid_levels=(),
+    ):
+        self._logs = {}
+        self._fields = {}
+        self._stats = {}
         self.temp_dir = None
+        if memmap and codecs:
+            raise ValueError("codecs are not supported in the memory-mapped mode")
         if path is None:
             self.setup_temporary_directory()
         else:
             Path(path).mkdir(parents=True, exist_ok=True)
             self.dir_path = Path(path).absolute()
         self.dtype = dtype
+        self.memmap = memmap
+        self.codecs = codecs or {}
+        self.pyramid_levels = tuple(sorted(pyramid_levels))
+        self.stats_dtype = statistics_dtype(n_hist_bins)
         self.grid = None
         self._data_range = None
+        self._step_index = None
+        self._written = {}
 
     def __del__(self):
         self.cleanup()
 
     def cleanup(self):
+        self._close_logs()
+        self._fields = {}
+        self._stats = {}
         if self.temp_dir is not None:
             self.temp_dir.cleanup()
 
@@ -35,51 +143,224 @@ class Storage:
     def init(self, settings):
         self.grid = settings.grid
         self._data_range = {}
+        self._step_index = {
+            step: index for index, step in enumerate(settings.output_steps)
+        }
+        self._fields = {}
+        self._written = {}
+        self._stats = {}
+        self._close_logs()
         if self.temp_dir is not None and any(os.scandir(self.temp_dir.name)):
             self.setup_temporary_directory()
 
-    def _filepath(self, name: str, step: int = None):
+    def resume(self, settings, step: int):
+        """reopens the products saved (in `path`) by an interrupted run,
+        discarding anything saved after `step` (e.g., when restarting from
+        a checkpoint taken at that step)"""
+        self.init(settings)
+        n_saved = self._step_index[step] + 1
+        for entry in sorted(os.listdir(self.dir_path)):
+            match = self.STEP_FILE_PATTERN.match(entry)
+            if match is not None:
+                if int(match.group(1)) > step:
+                    os.remove(os.path.join(self.dir_path, entry))
+            elif entry.endswith(".log"):
+                name = entry[: -len(".log")]
+                values = self._load_log(name)[:n_saved]
+                with open(self._filepath(name, extension="log"), "r+b") as log:
+                    log.truncate(self.LOG_HEADER_SIZE + values.nbytes)
+                if np.isfinite(values).any():
+                    self._data_range[name] = (np.nanmin(values), np.nanmax(values))
+            elif entry.endswith(".stats.npy"):
+                name = entry[: -len(".stats.npy")]
+                stats = np.load(
+                    self._filepath(name, extension="stats.npy"), mmap_mode="r+"
+                )
+                stats["nan_count"][n_saved:] = -1
+                self._stats[name] = stats
+                self._data_range[name] = self.data_range(name)
+            elif self.memmap and entry.endswith(".npy"):
+                name = entry[: -len(".npy")]
+                field = np.load(self._filepath(name), mmap_mode="r+")
+                if field.shape[0] != len(self._step_index):
+                    raise Storage.Exception()
+                self._fields[name] = field
+                self._written[name] = np.arange(len(self._step_index)) < n_saved
+
+    def _filepath(self, name: str, step: int = None, extension: str = "npy"):
         if step is None:
-            filename = f"{name}.npy"
+            filename = f"{name}.{extension}"
         else:
-            filename = f"{name}_{step:06}.npy"
+            filename = f"{name}_{step:06}.{extension}"
         path = os.path.join(self.dir_path, filename)
         return path
 
+    def _field(self, name: str, shape: tuple):
+        if name not in self._fields:
+            self._fields[name] = np.lib.format.open_memmap(
+                self._filepath(name),
+                mode="w+",
+                dtype=self.dtype,
+                shape=(len(self._step_index), *shape),
+            )
+            self._written[name] = np.zeros(len(self._step_index), dtype=bool)
+        return self._fields[name]
+
+    def _update_statistics(self, name: str, step: int, data: np.ndarray):
+        if name not in self._stats:
+            stats = np.lib.format.open_memmap(
+                self._filepath(name, extension="stats.npy"),
+                mode="w+",
+                dtype=self.stats_dtype,
+                shape=(len(self._step_index),),
+            )
+            stats["nan_count"] = -1
+            self._stats[name] = stats
+        record = self._stats[name][self._step_index[step]]
+        update_statistics(record, data)
+        return record
+
+    def _close_logs(self):
+        for log in self._logs.values():
+            log.close()
+        self._logs = {}
+
+    def _append(self, name: str, step: int, value):
+        if step == 0 or name not in self._logs:
+            if name in self._logs:
+                self._logs[name].close()
+            path = self._filepath(name, extension="log")
+            if step != 0 and os.path.exists(path):
+                self._logs[name] = open(path, "ab")
+            else:
+                header = self.LOG_MAGIC + np.dtype(self.dtype).str.encode()
+                self._logs[name] = open(path, "wb")
+                self._logs[name].write(header.ljust(self.LOG_HEADER_SIZE))
+        self._logs[name].write(np.asarray(value, dtype=self.dtype).tobytes())
+        self._logs[name].flush()
+
+    def _load_log(self, name: str) -> np.ndarray:
+        with open(self._filepath(name, extension="log"), "rb") as log:
+            header = log.read(self.LOG_HEADER_SIZE)
+            if not header.startswith(self.LOG_MAGIC):
+                raise Storage.Exception()
+            dtype = np.dtype(header[len(self.LOG_MAGIC) :].decode().strip())
+            return np.fromfile(log, dtype=dtype)
+
+    @staticmethod
+    def _level_name(name: str, level: int):
+        return name if level == 1 else f"{name}_x{level}"
+
+    def pyramid_level(self, max_shape: tuple) -> int:
+        """the finest saved level with the coarsened grid not exceeding `max_shape`
+        (e.g., the number of pixels displayed), or the coarsest one if none fits"""
+        levels = (1, *self.pyramid_levels)
+        for level in levels:
+            if all(-(-n // level) <= m for n, m in zip(self.grid, max_shape)):
+                return level
+        return levels[-1]
+
+    def _save_field(self, name: str, step: int, data: np.ndarray):
+        if self.memmap:
+            index = self._step_index[step]
+            self._field(name, data.shape)[index] = data
+            self._written[name][index] = True
+        elif name in self.codecs:
+            storage_codecs.save(
+                self._filepath(name, step, extension="npz"),
+                self.codecs[name],
+                data.astype(self.dtype),
+            )
+        else:
+            np.save(self._filepath(name, step), data.astype(self.dtype))
+
     def save(self, data: (float, np.ndarray), step: int, name: str):
         if isinstance(data, (int, float)):
-            path = self._filepath(name)
-            np.save(
-                path,
-                np.concatenate(
-                    (() if step == 0 else np.load(path), (self.dtype(data),))
-                ),
-            )
+            self._append(name, step, data)
+            data_min, data_max = data, data
         elif data.shape[0:2] == self.grid:
-            np.save(self._filepath(name, step), data.astype(self.dtype))
+            self._save_field(name, step, data)
+            for level in self.pyramid_levels:
+                self._save_field(
+                    self._level_name(name, level), step, coarsen(data, level)
+                )
+            record = self._update_statistics(name, step, data)
+            data_min, data_max = record["min"], record["max"]
         else:
             raise NotImplementedError()
 
         if name not in self._data_range:
             self._data_range[name] = (np.inf, -np.inf)
-        just_nans = np.isnan(data).all()
-        self._data_range[name] = (
-            min(
-                self._data_range[name][0] if just_nans else np.nanmin(data),
-                self._data_range[name][0],
-            ),
-            max(
-                self._data_range[name][1] if just_nans else np.nanmax(data),
-                self._data_range[name][1],
-            ),
-        )
+        if not np.isnan(data_min):
+            self._data_range[name] = (
+                min(data_min, self._data_range[name][0]),
+                max(data_max, self._data_range[name][1]),
+            )
 
     def data_range(self, name):
+        if self._data_range is None or name not in self._data_range:
+            stats = self.statistics(name)
+            stats = stats[stats["nan_count"] >= 0]
+            saved = np.logical_not(np.isnan(stats["min"]))
+            if not saved.any():
+                return np.inf, -np.inf
+            return stats["min"][saved].min(), stats["max"][saved].max()
         return self._data_range[name]
 
-    def load(self, name: str, step: int = None) -> np.ndarray:
+    def statistics(self, name: str, step: int = None) -> np.ndarray:
+        """per-step statistics record of a field product (or the array of records
+        for all output steps if `step` is None, with `nan_count == -1` marking
+        steps not saved yet), read back from disk if not saved in this process"""
+        if name in self._stats:
+            stats = self._stats[name]
+        else:
+            try:
+                stats = np.load(
+                    self._filepath(name, extension="stats.npy"), mmap_mode="r"
+                )
+            except FileNotFoundError as err:
+                raise Storage.Exception() from err
+        if step is None:
+            return stats
+        index = self._step_index.get(step) if self._step_index is not None else None
+        if index is None or stats[index]["nan_count"] < 0:
+            raise Storage.Exception()
+        return stats[index]
+
+    @staticmethod
+    def _read_only(array) -> np.ndarray:
+        array = array.view()
+        array.flags.writeable = False
+        return array
+
+    def flush(self):
+        for memmap in (*self._fields.values(), *self._stats.values()):
+            memmap.flush()
+
+    def load(self, name: str, step: int = None, level: int = 1) -> np.ndarray:
+        name = self._level_name(name, level)
+        if self.memmap and step is not None:
+            index = self._step_index.get(step)
+            if name not in self._fields or index is None:
+                raise Storage.Exception()
+            if not self._written[name][index]:
+                raise Storage.Exception()
+            return self._read_only(self._fields[name][index])
+        if self.memmap and step is None and name in self._fields:
+            return self._read_only(self._fields[name])
         try:
-            data = np.load(self._filepath(name, step))
+            if step is None:
+                if self.memmap and not os.path.exists(
+                    self._filepath(name, extension="log")
+                ):
+                    return self._read_only(np.load(self._filepath(name), mmap_mode="r"))
+                return self._load_log(name)
+            if name in self.codecs:
+                return storage_codecs.load(self._filepath(name, step, extension="npz"))
+            try:
+                data = np.load(self._filepath(name, step))
+            except FileNotFoundError:
+                data = storage_codecs.load(self._filepath(name, step, extension="npz"))
         except FileNotFoundError as err:
             raise Storage.Exception() from err
         return data
@@ -0,0 +1,119 @@
+"""per-product codecs for `Storage`: each codec maps a frame onto a set of arrays
+ kept in an `.npz` container together with the codec specification, so that
+ frames are decoded transparently on load"""
+import json
+
+import numpy as np
+
+
+class Codec:
+    def __init__(self, compress):
+        self.compress = compress
+
+    @property
+    def params(self):
+        return {"compress": self.compress}
+
+    def encode(self, data: np.ndarray) -> dict:
+        raise NotImplementedError()
+
+    def decode(self, arrays) -> np.ndarray:
+        raise NotImplementedError()
+
+
+class Lossless(Codec):
+    def __init__(self, compress=True):
+        super().__init__(compress)
+
+    def encode(self, data):
+        return {"data": data}
+
+    def decode(self, arrays):
+        return arrays["data"]
+
+
+class Float16(Codec):
+    """half-precision storage (note: magnitudes above 65504 overflow to inf)"""
+
+    def __init__(self, compress=False):
+        super().__init__(compress)
+
+    def encode(self, data):
+        return {"data": data.astype(np.float16), "dtype": np.array(data.dtype.str)}
+
+    def decode(self, arrays):
+        return arrays["data"].astype(str(arrays["dtype"]))
+
+
+class BitRound(Codec):
+    """rounds float32 mantissas to `keepbits` bits (to nearest, ties to even),
+    zeroing the trailing bits which makes them compress well"""
+
+    def __init__(self, keepbits, compress=True):
+        super().__init__(compress)
+        assert 0 <= keepbits <= 23
+        self.keepbits = keepbits
+
+    @property
+    def params(self):
+        return {**super().params, "keepbits": self.keepbits}
+
+    def encode(self, data):
+        data = np.asarray(data, dtype=np.float32)
+        bits = data.view(np.uint32).copy()
+        drop = 23 - self.keepbits
+        if drop > 0:
+            half = np.uint32((1 << (drop - 1)) - 1)
+            bits += half + ((bits >> np.uint32(drop)) & np.uint32(1))
+            bits &= np.uint32(0xFFFFFFFF ^ ((1 << drop) - 1))
+        return {"data": np.where(np.isnan(data), data, bits.view(np.float32))}
+
+    def decode(self, arrays):
+        return arrays["data"]
+
+
+class Sparse(Codec):
+    """keeps only the values differing from `fill_value` (NaN allowed)
+    together with their flat indices"""
+
+    def __init__(self, fill_value=0.0, compress=False):
+        super().__init__(compress)
+        self.fill_value = fill_value
+
+    @property
+    def params(self):
+        return {**super().params, "fill_value": self.fill_value}
+
+    def encode(self, data):
+        flat = data.ravel()
+        if np.isnan(self.fill_value):
+            mask = np.logical_not(np.isnan(flat))
+        else:
+            mask = flat != self.fill_value
+        indices = np.flatnonzero(mask)
+        if flat.size <= np.iinfo(np.uint32).max:
+            indices = indices.astype(np.uint32)
+        return {"shape": np.array(data.shape), "indices": indices, "values": flat[mask]}
+
+    def decode(self, arrays):
+        values = arrays["values"]
+        data = np.full(tuple(arrays["shape"]), self.fill_value, dtype=values.dtype)
+        data.flat[arrays["indices"]] = values
+        return data
+
+
+CODECS = {cls.__name__: cls for cls in (Lossless, Float16, BitRound, Sparse)}
+
+
+def save(path, codec: Codec, data: np.ndarray):
+    arrays = codec.encode(data)
+    arrays["codec"] = np.array(
+        json.dumps({"name": codec.__class__.__name__, "params": codec.params})
+    )
+    (np.savez_compressed if codec.compress else np.savez)(path, **arrays)
+
+
+def load(path) -> np.ndarray:
+    with np.load(path) as arrays:
+        spec = json.loads(str(arrays["codec"]))
+        return CODECS[spec["name"]](**spec["params"]).decode(arrays)
@@ -0,0 +1,25 @@
+class Subscriptions:
+    """registry of products needed by consumers of `Simulation` outputs (storages,
+    exporters, viewers); each consumer (any hashable key) declares the names of
+    the products it needs (`None` meaning all) and the cadence (every how many
+    output steps); products not due for any consumer are not evaluated (NaN
+    being saved in place of scalar products so that their series stay aligned
+    with output steps; note that products accumulating between outputs, e.g.
+    timestep extrema, then cover the whole period since their last evaluation)"""
+
+    def __init__(self):
+        self._needs = {}
+
+    def subscribe(self, consumer, names=None, every: int = 1):
+        assert every > 0
+        self._needs[consumer] = (None if names is None else frozenset(names), every)
+
+    def unsubscribe(self, consumer):
+        self._needs.pop(consumer, None)
+
+    def is_due(self, name: str, index: int) -> bool:
+        """whether product `name` is needed at the output step number `index`"""
+        return any(
+            (names is None or name in names) and index % every == 0
+            for names, every in tuple(self._needs.values())
+        )
@@ -0,0 +1,138 @@
+import itertools
+import os
+import shutil
+from concurrent.futures import as_completed
+
+import numpy as np
+from PySDM import Formulae
+
+from PySDM_examples.Szumowski_et_al_1998.gui_settings import GUISettings
+from PySDM_examples.Szumowski_et_al_1998.simulation import Simulation
+from PySDM_examples.Szumowski_et_al_1998.spin_up_cache import digest
+from PySDM_examples.Szumowski_et_al_1998.storage import Storage
+from PySDM_examples.utils import process_pool
+
+
+def _qualname(obj):
+    return None if obj is None else f"{obj.__module__}.{obj.__qualname__}"
+
+
+def apply(gui_settings: GUISettings, parameters: dict):
+    """sets the widgets of `gui_settings` named by keys of `parameters`
+    (see `GUISettings.widget()`) to the corresponding values"""
+    for name, value in parameters.items():
+        widget = gui_settings.widget(name)
+        if isinstance(widget.value, bool):
+            value = bool(value)
+        elif isinstance(widget.value, int):
+            value = int(round(value))
+        widget.value = value
+        if widget.value != value:
+            raise ValueError(f"{name}={value} is outside of the widget range")
+
+
+def run_member(settings_class, SpinUp, parameters: dict, seed: int, path: str):
+    """runs a single sweep member (in a worker process) storing its outputs
+    under `path` (written into a temporary directory and then renamed so that
+    an interrupted run never leaves a partial cache entry behind)"""
+    gui_settings = GUISettings(settings_class(Formulae(seed=seed)))
+    apply(gui_settings, parameters)
+    gui_settings.seed = seed
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    shutil.rmtree(temp_path, ignore_errors=True)
+    storage = Storage(path=temp_path)
+    simulation = Simulation(gui_settings, storage, SpinUp)
+    simulation.reinit()
+    simulation.run()
+    storage.flush()
+    storage.cleanup()
+    try:
+        os.replace(temp_path, path)
+    except OSError:  # completed meanwhile by another sweep sharing the cache
+        shutil.rmtree(temp_path, ignore_errors=True)
+    return path
+
+
+class Sweep:
+    """runs `Simulation`s for a sample of `GUISettings` parameters (dicts keyed
+    by widget names, e.g. `dth0` or `freezing.model`, see `grid()` and
+    `latin_hypercube()`) in a pool of `n_processes` worker processes; outputs
+    of each member are stored in `cache_path/<key>` with the key being a digest
+    of the parameters, seed, settings and spin-up classes and package versions,
+    so that members already run (by this or any other sweep) are reused"""
+
+    def __init__(
+        self, cache_path, settings_class, SpinUp=None, seed=44, n_processes=None
+    ):
+        self.cache_path = cache_path
+        self.settings_class = settings_class
+        self.SpinUp = SpinUp
+        self.seed = seed
+        self.n_processes = n_processes
+        self.versions = settings_class(Formulae(seed=seed)).versions
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def grid(**values) -> list:
+        """all combinations of given values, e.g. `grid(dth0=(1, 2), kappa=(.5, 1))`"""
+        return [
+            dict(zip(values.keys(), combination))
+            for combination in itertools.product(*values.values())
+        ]
+
+    @staticmethod
+    def latin_hypercube(n_samples: int, seed=None, **ranges) -> list:
+        """`n_samples` parameter sets with each of the `(min, max)` `ranges` split
+        into `n_samples` strata each sampled exactly once"""
+        rng = np.random.default_rng(seed)
+        columns = {
+            name: low
+            + (high - low)
+            * (rng.permutation(n_samples) + rng.uniform(size=n_samples))
+            / n_samples
+            for name, (low, high) in ranges.items()
+        }
+        return [
+            {name: float(column[sample]) for name, column in columns.items()}
+            for sample in range(n_samples)
+        ]
+
+    def key(self, parameters: dict) -> str:
+        return digest(
+            {
+                "settings": _qualname(self.settings_class),
+                "SpinUp": _qualname(self.SpinUp),
+                "parameters": dict(sorted(parameters.items())),
+                "seed": self.seed,
+                "versions": self.versions,
+            }
+        )
+
+    def run(self, samples: list) -> list:
+        """returns a list of `Storage`s with outputs for each of the `samples`"""
+        os.makedirs(self.cache_path, exist_ok=True)
+        paths = [os.path.join(self.cache_path, self.key(sample)) for sample in samples]
+        pending = {}
+        for path, sample in zip(paths, samples):
+            if os.path.isdir(path):
+                self.hits += 1
+            elif path not in pending:
+                self.misses += 1
+                pending[path] = sample
+        if pending:
+            with process_pool(self.n_processes) as executor:
+                futures = [
+                    executor.submit(
+                        run_member,
+                        self.settings_class,
+                        self.SpinUp,
+                        sample,
+                        self.seed,
+                        path,
+                    )
+                    for path, sample in pending.items()
+                ]
+                for future in as_completed(futures):
+                    future.result()
+        return [Storage(path=path) for path in paths]
@@ -0,0 +1,84 @@
+from queue import Queue
+from threading import Lock, Thread
+
+import numpy as np
+
+
+class WriteBehind:
+    """wraps a `Storage` so that `save()` only copies product snapshots into
+    a bounded pool of reusable buffers, while dtype conversion, data-range
+    tracking and disk writes are handled by a background writer thread;
+    `save()` blocks once `max_pending` snapshots are queued (backpressure)
+    and `flush()` returns once all of them have been written"""
+
+    def __init__(self, storage, max_pending=16):
+        self.storage = storage
+        self._queue = Queue(maxsize=max_pending)
+        self._free_buffers = {}
+        self._lock = Lock()
+        self._thread = None
+        self._errors = []
+
+    def __getattr__(self, item):
+        return getattr(self.storage, item)
+
+    def init(self, settings):
+        self.flush()
+        self.storage.init(settings)
+
+    def resume(self, settings, step: int):
+        self.flush()
+        self.storage.resume(settings, step)
+
+    def _buffer(self, data: np.ndarray):
+        key = (data.shape, data.dtype)
+        with self._lock:
+            free = self._free_buffers.get(key, [])
+            buffer = free.pop() if free else np.empty_like(data)
+        np.copyto(buffer, data)
+        return buffer
+
+    def _release(self, buffer):
+        if isinstance(buffer, np.ndarray):
+            with self._lock:
+                key = (buffer.shape, buffer.dtype)
+                self._free_buffers.setdefault(key, []).append(buffer)
+
+    def _work(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                break
+            data, step, name = item
+            try:
+                if not self._errors:
+                    self.storage.save(data, step, name)
+            except BaseException as err:  # pylint: disable=broad-except
+                self._errors.append(err)
+            finally:
+                self._release(data)
+                self._queue.task_done()
+
+    def _check(self):
+        if self._errors:
+            err = self._errors[0]
+            self._errors.clear()
+            raise err
+
+    def save(self, data: (float, np.ndarray), step: int, name: str):
+        self._check()
+        if self._thread is None:
+            self._thread = Thread(target=self._work, daemon=True)
+            self._thread.start()
+        if isinstance(data, np.ndarray):
+            data = self._buffer(data)
+        self._queue.put((data, step, name))
+
+    def flush(self):
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        self._check()
+        self.storage.flush()
@@ -1,15 +1,24 @@
 import numpy as np
 import PySDM.products as PySDM_products
+from PySDM.backends import CPU
 from PySDM.dynamics import Collision
 from PySDM.dynamics.collisions.collision_kernels import Geometric
 from PySDM.physics import si
 
+from PySDM_examples.Shipway_and_Hill_2012.output_schedule import OutputSchedule
 from PySDM_examples.Shipway_and_Hill_2012.simulation import Simulation as SimulationSH
 
 
 class Simulation1D(SimulationSH):
-    def __init__(self, settings):
-        super().__init__(settings)
+    def __init__(self, settings, backend=CPU):
+        super().__init__(
+            settings,
+            backend=backend,
+            output_schedule=OutputSchedule(dt=settings.dt, nt=settings.nt)
+            .add("scalar", steps=settings.output_steps)
+            .add("spectrum", times=settings.save_spec_and_attr_times)
+            .add("attributes", times=settings.save_spec_and_attr_times),
+        )
         self.output_steps = settings.output_steps
 
     @staticmethod
@@ -51,17 +60,3 @@ class Simulation1D(SimulationSH):
                 name="dvdlnr", radius_bins_edges=radius_bins_edges
             )
         )
-
-    def save(self, step):
-        if step in self.output_steps:
-            super().save(step)
-
-    def run(self):
-        result = super().run()
-        for key, val in result.products.items():
-            if len(val.shape) == 2:
-                result.products[key] = val[:, self.output_steps]
-            elif len(val.shape) == 3:
-                result.products[key] = val[:, :, :]
-        result.products["t"] = result.products["t"][self.output_steps]
-        return result
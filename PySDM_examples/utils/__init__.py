@@ -1,4 +1,13 @@
 from .basic_simulation import BasicSimulation
 from .dummy_controller import DummyController
+from .output_recorder import OutputRecorder
+from .process_pool import process_pool
 from .progbar_controller import ProgBarController
 from .read_vtk_1d import readVTK_1d
+from .split_population import split_population
+from .validation import (
+    checks_enabled,
+    get_validation_level,
+    set_validation_level,
+    validation_level,
+)
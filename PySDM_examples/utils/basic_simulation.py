@@ -1,21 +1,28 @@
 import numpy as np
 
+from PySDM_examples.utils.output_recorder import OutputRecorder
+
 
 class BasicSimulation:
     def __init__(self, particulator):
         self.particulator = particulator
 
     def _save(self, output):
-        for k, v in self.particulator.products.items():
-            value = v.get()
-            if isinstance(value, np.ndarray) and value.shape[0] == 1:
-                value = value[0]
-            output[k].append(value)
+        output.record(self.particulator)
 
-    def _run(self, nt, steps_per_output_interval):
-        output = {k: [] for k in self.particulator.products}
+    def _run(self, nt, steps_per_output_interval, every=None) -> OutputRecorder:
+        """returns an `OutputRecorder` with product values at the initial step and
+        after each of the output intervals (products listed in `every` being
+        recorded only every given number of outputs)"""
+        intervals = range(0, nt + 1, steps_per_output_interval)
+        output = OutputRecorder(
+            names=self.particulator.products,
+            steps=np.arange(len(intervals) + 1) * steps_per_output_interval,
+            dt=self.particulator.dt,
+            every=every,
+        )
         self._save(output)
-        for _ in range(0, nt + 1, steps_per_output_interval):
+        for _ in intervals:
             self.particulator.run(steps=steps_per_output_interval)
             self._save(output)
         return output
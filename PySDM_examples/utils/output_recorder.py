@@ -0,0 +1,53 @@
+from collections.abc import Mapping
+
+import numpy as np
+
+
+class OutputRecorder(Mapping):
+    """records values of products (`names`) at output `steps` into one contiguous
+    array per product, allocated at the first record with the product's dtype
+    and shape (with a leading dimension of length one, e.g. the single cell of
+    a parcel, dropped) and filled in place afterwards; `every` maps product names
+    to the number of outputs between subsequent records (entries for outputs at
+    which a product is skipped are NaN); indexing by product name returns the
+    arrays, and `t` holds the time of each output"""
+
+    def __init__(self, names, steps, dt: float, every: dict = None):
+        self.names = names
+        self.steps = np.asarray(steps)
+        self.t = self.steps * dt
+        self.every = every or {}
+        self.index = 0
+        self.data = {}
+
+    def _allocate(self, name, value):
+        every = self.every.get(name, 1)
+        dtype = value.dtype
+        if every > 1 and not np.issubdtype(dtype, np.floating):
+            dtype = float
+        shape = (len(self.steps), *value.shape)
+        if np.issubdtype(dtype, np.floating):
+            self.data[name] = np.full(shape, np.nan, dtype=dtype)
+        else:
+            self.data[name] = np.zeros(shape, dtype=dtype)
+
+    def record(self, particulator):
+        for name, product in particulator.products.items():
+            if name not in self.names or self.index % self.every.get(name, 1):
+                continue
+            value = np.asarray(product.get())
+            if value.ndim > 0 and value.shape[0] == 1:
+                value = value[0]
+            if name not in self.data:
+                self._allocate(name, value)
+            self.data[name][self.index] = value
+        self.index += 1
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.data[name]
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __len__(self):
+        return len(self.data)
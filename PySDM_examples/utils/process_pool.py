@@ -0,0 +1,10 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+
+def process_pool(n_processes=None) -> ProcessPoolExecutor:
+    """pool of `n_processes` worker processes started with the `spawn` method
+    (forking may abort after OpenMP-threaded Numba code ran in the parent)"""
+    return ProcessPoolExecutor(
+        max_workers=n_processes, mp_context=multiprocessing.get_context("spawn")
+    )
@@ -0,0 +1,34 @@
+import numpy as np
+
+
+def split_population(attributes: dict, fractions: tuple, fill: dict = None) -> dict:
+    """returns attributes of a population in which each of the super-droplets
+    described by `attributes` is replaced by `len(fractions)` copies (stored
+    copy after copy, i.e., the first copies of all super-droplets come first)
+    with multiplicities `n` scaled by the corresponding `fractions`; `fill` maps
+    attribute names to per-copy values assigned instead of the original ones
+    (`None` meaning copy); the result arrays are allocated once and filled
+    in place, attributes of shape `(..., n_sd)` are split along the last axis"""
+    fill = fill or {}
+    n_sd = attributes["n"].shape[-1]
+    n_copies = len(fractions)
+    for name, array in attributes.items():
+        if array.shape[-1] != n_sd:
+            raise AssertionError(f"attribute >>{name}<< has wrong size")
+    for name, values in fill.items():
+        if name not in attributes or len(values) != n_copies:
+            raise AssertionError(f"fill values for >>{name}<< do not match")
+
+    result = {}
+    for name, array in attributes.items():
+        result[name] = np.empty((*array.shape[:-1], n_copies * n_sd), array.dtype)
+        for copy, fraction in enumerate(fractions):
+            part = result[name][..., copy * n_sd : (copy + 1) * n_sd]
+            value = fill.get(name, (None,) * n_copies)[copy]
+            if value is not None:
+                part[...] = value
+            elif name == "n":
+                np.multiply(array, fraction, out=part, casting="unsafe")
+            else:
+                part[...] = array
+    return result
@@ -0,0 +1,53 @@
+"""
+level of sanity checks carried out within the time-stepping loops of the examples:
+`off` (none), `default` (as originally in each example) or `paranoid` (checks
+otherwise carried out once or every few steps are done on every step); the initial
+value is taken from the `PySDM_EXAMPLES_VALIDATION` environment variable (an
+unrecognised value is reported with a warning and `default` is used instead)
+"""
+import os
+import warnings
+from contextlib import contextmanager
+
+LEVELS = ("off", "default", "paranoid")
+
+
+def _level_from_environment() -> str:
+    level = os.environ.get("PySDM_EXAMPLES_VALIDATION", "default")
+    if level not in LEVELS:
+        warnings.warn(
+            f"ignoring PySDM_EXAMPLES_VALIDATION={level!r} (not one of {LEVELS}),"
+            " using 'default'"
+        )
+        return "default"
+    return level
+
+
+_level = _level_from_environment()
+
+
+def get_validation_level() -> str:
+    return _level
+
+
+def set_validation_level(level: str) -> str:
+    """sets the validation level returning the previous one"""
+    global _level  # pylint: disable=global-statement
+    if level not in LEVELS:
+        raise ValueError(f"validation level must be one of {LEVELS}")
+    previous, _level = _level, level
+    return previous
+
+
+@contextmanager
+def validation_level(level: str):
+    previous = set_validation_level(level)
+    try:
+        yield
+    finally:
+        set_validation_level(previous)
+
+
+def checks_enabled(level: str = "default") -> bool:
+    """whether checks pertinent to the given `level` are to be carried out"""
+    return LEVELS.index(_level) >= LEVELS.index(level)
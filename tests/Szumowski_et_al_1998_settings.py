@@ -0,0 +1,24 @@
+from PySDM import Formulae
+
+from PySDM_examples.Arabas_et_al_2015 import Settings
+
+
+def small_settings(
+    seed=44, *, n_steps=4, output_every=2, spin_up_steps=None, processes=None, **kwargs
+):
+    """`Arabas_et_al_2015.Settings` for short test runs: `n_steps` timesteps on
+    an 8x8 grid with output every `output_every` steps, condensation disabled
+    unless enabled in `processes` (overriding entries of `settings.processes`)
+    and remaining `kwargs` set as attributes (e.g. `n_sd_per_gridbox=8`)"""
+    settings = Settings(Formulae(seed=seed))
+    settings.grid = (8, 8)
+    settings.n_sd_per_gridbox = 4
+    settings.simulation_time = settings.dt * n_steps
+    settings.output_interval = settings.dt * output_every
+    if spin_up_steps is not None:
+        settings.spin_up_time = settings.dt * spin_up_steps
+    settings.processes["condensation"] = False
+    settings.processes.update(processes or {})
+    for key, value in kwargs.items():
+        setattr(settings, key, value)
+    return settings
@@ -1,6 +1,8 @@
 import os
 from tempfile import TemporaryDirectory
 
+import numpy as np
+import pytest
 from open_atmos_jupyter_utils import TemporaryFile
 from PySDM import Formulae
 from PySDM.backends import CPU
@@ -9,6 +11,7 @@ from scipy.io import netcdf
 
 from PySDM_examples.Arabas_et_al_2015 import Settings, SpinUp
 from PySDM_examples.Szumowski_et_al_1998.gui_settings import GUISettings
+from PySDM_examples.Szumowski_et_al_1998.netcdf_sink import NetCDFSink
 from PySDM_examples.Szumowski_et_al_1998.simulation import Simulation
 from PySDM_examples.Szumowski_et_al_1998.storage import Storage
 from PySDM_examples.utils import DummyController
@@ -55,3 +58,84 @@ def test_Arabas_et_al_2015_export():
     assert len(list(filter(lambda x: x.endswith(".pvd"), filenames_list))) == 2
     assert len(list(filter(lambda x: x.endswith(".vts"), filenames_list))) == 2
     assert len(list(filter(lambda x: x.endswith(".vtu"), filenames_list))) == 2
+
+
+def test_Arabas_et_al_2015_streaming_export():
+    # Arrange
+    settings = GUISettings(Settings(Formulae()))
+    settings.ui_simulation_time = IntSlider(value=20)
+    settings.ui_dt = IntSlider(value=10)
+    settings.ui_output_options["interval"] = IntSlider(value=settings.ui_dt.value)
+
+    storage = Storage()
+    simulator = Simulation(
+        settings=settings, storage=storage, SpinUp=SpinUp, backend_class=CPU
+    )
+    streamed_file = TemporaryFile()
+    simulator.storage = NetCDFSink(
+        settings=settings,
+        simulator=simulator,
+        filename=streamed_file.absolute_path,
+        storage=storage,
+    )
+    exported_file = TemporaryFile()
+    ncdf_exporter = NetCDFExporter(
+        storage=storage,
+        settings=settings,
+        simulator=simulator,
+        filename=exported_file.absolute_path,
+    )
+
+    # Act
+    simulator.reinit()
+    simulator.run()
+    ncdf_exporter.run(controller=DummyController())
+
+    # Assert
+    with netcdf.netcdf_file(  # pylint: disable=no-member
+        streamed_file.absolute_path, mmap=False
+    ) as streamed, netcdf.netcdf_file(  # pylint: disable=no-member
+        exported_file.absolute_path, mmap=False
+    ) as exported:
+        assert streamed.dimensions["T"] is None
+        assert streamed.variables["T"].shape == (len(settings.output_steps),)
+        assert streamed.variables.keys() == exported.variables.keys()
+        for name, variable in exported.variables.items():
+            np.testing.assert_array_equal(streamed.variables[name][:], variable[:])
+
+
+def test_Arabas_et_al_2015_streaming_export_written_once_on_flush():
+    # Arrange
+    settings = GUISettings(Settings(Formulae()))
+    settings.ui_simulation_time = IntSlider(value=20)
+    settings.ui_dt = IntSlider(value=10)
+    settings.ui_output_options["interval"] = IntSlider(value=settings.ui_dt.value)
+
+    simulator = Simulation(
+        settings=settings, storage=None, SpinUp=SpinUp, backend_class=CPU
+    )
+    file = TemporaryFile()
+    sut = NetCDFSink(
+        settings=settings, simulator=simulator, filename=file.absolute_path
+    )
+    simulator.reinit()
+    sut.init(settings)
+
+    # Act
+    for name, product in simulator.products.items():
+        sut.save(product.get(), 0, name)
+    sut.save(0.0, 1, "RH_env")
+
+    # Assert
+    assert os.path.getsize(file.absolute_path) == 0
+    with pytest.raises(NetCDFSink.Exception):
+        sut.data_range("RH_env")
+    with pytest.raises(NetCDFSink.Exception):
+        sut.pyramid_level((4, 4))
+    sut.flush()
+    with netcdf.netcdf_file(  # pylint: disable=no-member
+        file.absolute_path, mmap=False
+    ) as flushed:
+        assert flushed.variables["T"].shape == (2,)
+        assert np.isnan(flushed.variables["T_env"][1]).all()
+        assert not np.isnan(flushed.variables["T_env"][0]).any()
@@ -0,0 +1,89 @@
+import os
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+
+import numpy as np
+from PySDM import Formulae
+from PySDM.physics import si
+
+from PySDM_examples.Shipway_and_Hill_2012 import Settings, Simulation
+from PySDM_examples.Shipway_and_Hill_2012.attribute_recorder import AttributeRecorder
+
+
+def _attribute(values):
+    values = np.asarray(values)
+    return SimpleNamespace(
+        shape=values.shape, dtype=values.dtype, to_ndarray=values.copy
+    )
+
+
+def test_snapshots_written_in_place_with_requested_dtypes():
+    # arrange
+    particulator = SimpleNamespace(
+        attributes={
+            "radius": _attribute(np.linspace(1, 2, 4)),
+            "n": _attribute(np.arange(4, dtype=np.int64)),
+        }
+    )
+    sut = AttributeRecorder(
+        particulator, attributes={"radius": np.float32, "n": None}, n_snapshots=3
+    )
+    buffers = dict(sut.buffers)
+
+    # act
+    sut.record(particulator, 0)
+    particulator.attributes["radius"] = _attribute(np.linspace(3, 4, 2))
+    particulator.attributes["n"] = _attribute(np.arange(2, dtype=np.int64))
+    sut.record(particulator, 2)
+
+    # assert
+    assert all(sut.buffers[name] is buffer for name, buffer in buffers.items())
+    assert sut.buffers["radius"].dtype == np.float32
+    assert sut.buffers["n"].dtype == np.int64
+    assert tuple(sut.count) == (4, 0, 2)
+    np.testing.assert_array_equal(
+        sut["radius"][0], np.linspace(1, 2, 4).astype(np.float32)
+    )
+    np.testing.assert_array_equal(
+        sut["radius"][1], np.linspace(3, 4, 2).astype(np.float32)
+    )
+    np.testing.assert_array_equal(sut["n"][1], np.arange(2))
+    assert len(sut["n"]) == 2
+
+
+def test_memory_mapped_attributes_and_restricted_profiles():
+    # arrange
+    tmp = TemporaryDirectory()
+    settings = Settings(
+        n_sd_per_gridbox=32,
+        dt=1 * si.s,
+        dz=50 * si.m,
+        z_max=500 * si.m,
+        t_max=20 * si.s,
+        formulae=Formulae(seed=44),
+        save_spec_and_attr_times=(0 * si.s, 10 * si.s, 20 * si.s),
+    )
+    settings.output_attributes = {"radius": np.float32, "n": None}
+    settings.output_attributes_path = tmp.name
+    settings.output_profiles = ("RH", "qv")
+    simulation = Simulation(settings)
+    initial_radius = simulation.particulator.attributes["radius"].to_ndarray()
+
+    # act
+    output = simulation.run()
+
+    # assert
+    assert sorted(os.listdir(tmp.name)) == ["n.npy", "radius.npy"]
+    radius = np.load(os.path.join(tmp.name, "radius.npy"))
+    assert radius.dtype == np.float32
+    assert radius.shape == (3, settings.n_sd)
+    for index, snapshot in enumerate(output.attributes["radius"]):
+        np.testing.assert_array_equal(snapshot, radius[index, : snapshot.size])
+    np.testing.assert_array_equal(
+        output.attributes["radius"][0], initial_radius.astype(np.float32)
+    )
+    assert len(output.attributes["n"]) == 3
+
+    profiles = {name for name, data in output.products.items() if data.ndim == 2}
+    assert profiles == {"RH", "qv"}
+    assert "wet spectrum" in output.products
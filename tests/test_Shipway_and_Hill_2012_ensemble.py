@@ -0,0 +1,68 @@
+import numpy as np
+from PySDM import Formulae
+from PySDM.backends import CPU
+from PySDM.physics import si
+
+from PySDM_examples.Shipway_and_Hill_2012 import Ensemble, Settings
+from PySDM_examples.Shipway_and_Hill_2012.ensemble import warm_backend
+
+COMMON = {
+    "n_sd_per_gridbox": 32,
+    "dt": 1 * si.s,
+    "dz": 50 * si.m,
+    "z_max": 500 * si.m,
+    "t_max": 20 * si.s,
+}
+
+
+def test_members_stacked_on_union_of_heights():
+    # arrange
+    members = [
+        {**COMMON, "rho_times_w_1": 2 * si.kg / si.m**3 * si.m / si.s},
+        {**COMMON, "rho_times_w_1": 3 * si.kg / si.m**3 * si.m / si.s},
+        {**COMMON, "unknown_setting": 1},
+    ]
+    sut = Ensemble(members, products=("RH", "qv"), n_processes=1)
+
+    # act
+    result = sut.run()
+
+    # assert
+    assert list(result.failures) == [2]
+    assert "TypeError" in result.failures[2]
+    assert sorted(result.products) == ["RH", "qv"]
+    for data in result.products.values():
+        assert data.shape == (len(members), len(result.z), len(result.t))
+        assert np.isnan(data[2]).all()
+
+    heights = []
+    for member in members[:2]:
+        settings = Settings(**member)
+        heights.append(
+            (np.arange(settings.nz) + 0.5) * settings.dz
+            - settings.particle_reservoir_depth
+        )
+    assert len(heights[0]) < len(heights[1])
+    np.testing.assert_allclose(result.z, np.union1d(heights[0], heights[1]))
+    for member, z in enumerate(heights):
+        defined = np.isin(np.round(result.z, 6), np.round(z, 6))
+        assert not np.isnan(result.products["qv"][member, defined]).any()
+        assert np.isnan(result.products["qv"][member, ~defined]).all()
+    assert np.isnan(result.products["qv"][0]).any()
+
+
+def test_warm_backend_reused_for_formulae_differing_in_seed():
+    # arrange
+    sut = warm_backend(CPU)
+
+    # act
+    backends = [
+        sut(Formulae(seed=1)),
+        sut(Formulae(seed=2)),
+        sut(Formulae(seed=1, condensation_coordinate="Volume")),
+    ]
+
+    # assert
+    assert backends[0] is backends[1]
+    assert backends[1].formulae.seed == 2
+    assert backends[2] is not backends[0]
@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+from PySDM import Formulae
+from PySDM.backends import CPU
+from PySDM.physics import si
+
+from PySDM_examples.Shipway_and_Hill_2012 import Settings, Simulation
+from PySDM_examples.Shipway_and_Hill_2012 import simulation as simulation_module
+from PySDM_examples.Shipway_and_Hill_2012.ensemble import warm_backend
+from PySDM_examples.Shipway_and_Hill_2012.mpdata_1d import MPDATA_1D
+
+NT = 30
+
+
+def _scalar_advector(t):
+    return 0.5 * np.sin(t) if t < 5 else 0
+
+
+def _profile_advector(t):
+    return _scalar_advector(t) * np.linspace(0, 1, 9)
+
+
+def _mpdata(nt, advector_of_t=_scalar_advector):
+    return MPDATA_1D(
+        nz=8,
+        dt=0.3,
+        advector_of_t=advector_of_t,
+        advectee_of_zZ_at_t0=np.ones_like,
+        g_factor_of_zZ=np.ones_like,
+        mpdata_settings={"n_iters": 2, "iga": True, "fct": True, "tot": True},
+        nt=nt,
+    )
+
+
+@pytest.mark.parametrize("advector_of_t", (_scalar_advector, _profile_advector))
+def test_precomputed_advector_series_matches_per_step_evaluation(advector_of_t):
+    # arrange
+    sut = _mpdata(nt=NT, advector_of_t=advector_of_t)
+    reference = _mpdata(nt=None, advector_of_t=advector_of_t)
+
+    # act
+    advectors, expected, changed = [], [], []
+    for _ in range(NT):
+        sut.update_advector_field()
+        reference.update_advector_field()
+        advectors.append(sut.advector.copy())
+        expected.append(reference.advector.copy())
+        changed.append(sut.changed)
+
+    # assert
+    np.testing.assert_array_equal(advectors, expected)
+    assert changed[0] and not changed[-1]
+    np.testing.assert_array_equal(
+        changed[1:], (np.diff(np.asarray(expected), axis=0) != 0).any(axis=1)
+    )
+
+
+def test_advector_series_exhausted():
+    # arrange
+    sut = _mpdata(nt=NT)
+    for _ in range(NT):
+        sut.update_advector_field()
+
+    # act & assert
+    with pytest.raises(ValueError, match="nt=30"):
+        sut.update_advector_field()
+
+
+def test_skipped_courant_uploads_leave_outputs_unchanged(monkeypatch):
+    # arrange
+    def run():
+        settings = Settings(
+            n_sd_per_gridbox=32,
+            dt=2 * si.s,
+            dz=50 * si.m,
+            z_max=500 * si.m,
+            t_max=640 * si.s,
+            formulae=Formulae(seed=44),
+        )
+        return Simulation(settings, backend=warm_backend(CPU)).run().products
+
+    # act
+    output = run()
+    monkeypatch.setattr(
+        simulation_module,
+        "MPDATA_1D",
+        lambda **kwargs: MPDATA_1D(**{**kwargs, "nt": None}),
+    )
+    reference = run()
+
+    # assert
+    assert output.keys() == reference.keys()
+    for name, data in reference.items():
+        np.testing.assert_array_equal(output[name], data)
@@ -0,0 +1,74 @@
+import numpy as np
+from PySDM import Formulae
+from PySDM.backends import CPU
+from PySDM.physics import si
+
+from PySDM_examples.deJong_Mackay_2022 import Settings1D, Simulation1D
+from PySDM_examples.Shipway_and_Hill_2012 import OutputSchedule
+from PySDM_examples.Shipway_and_Hill_2012.ensemble import warm_backend
+
+# products not accumulating between outputs (hence independent of the cadence)
+INSTANTANEOUS = ("RH", "p", "T", "qv", "qc", "qr", "rhod", "thd", "nc", "nr", "na")
+
+
+def test_per_group_cadences_and_irregular_times():
+    # arrange
+    sut = OutputSchedule(dt=1 * si.s, nt=10)
+
+    # act
+    sut.add("scalar", steps=range(0, 11, 2)).add(
+        "spectrum", times=(0, 2.96 * si.s, 4.5 * si.s, 7.04 * si.s, 20 * si.s)
+    )
+
+    # assert
+    assert sut.n_slots("scalar") == 6
+    assert [sut.slot("scalar", step) for step in range(5)] == [0, -1, 1, -1, 2]
+    np.testing.assert_array_equal(sut.times("scalar"), np.arange(0, 11, 2))
+
+    assert sut.n_slots("spectrum") == 5
+    np.testing.assert_array_equal(sut.steps("spectrum"), (0, 3, -1, 7, -1))
+    np.testing.assert_array_equal(sut.times("spectrum"), (0, 3, np.nan, 7, np.nan))
+    assert [sut.slot("spectrum", step) for step in (0, 3, 4, 5, 7, 10)] == [
+        0,
+        1,
+        -1,
+        -1,
+        3,
+        -1,
+    ]
+
+
+def test_deJong_Mackay_2022_outputs_at_output_steps():
+    # arrange
+    def settings(output_every_n_steps):
+        result = Settings1D(
+            n_sd_per_gridbox=32,
+            dt=1 * si.s,
+            dz=50 * si.m,
+            z_max=500 * si.m,
+            t_max=20 * si.s,
+            output_every_n_steps=output_every_n_steps,
+            save_spec_at=(5 * si.s, 15 * si.s),
+        )
+        result.formulae = Formulae(
+            fragmentation_function=result.fragmentation_function.__class__.__name__,
+            seed=44,
+        )
+        return result
+
+    backend = warm_backend(CPU)
+    sut = settings(output_every_n_steps=4)
+
+    # act
+    output = Simulation1D(sut, backend=backend).run().products
+    reference = Simulation1D(settings(1), backend=backend).run().products
+
+    # assert
+    steps = np.asarray(sut.output_steps)
+    np.testing.assert_array_equal(output["t"], steps * sut.dt)
+    for name in INSTANTANEOUS:
+        assert output[name].shape == (sut.nz, len(steps))
+        np.testing.assert_array_equal(output[name], reference[name][:, steps])
+    for name in ("wet spectrum", "dry spectrum", "N(v)", "dvdlnr"):
+        assert output[name].shape[-1] == 2
+        np.testing.assert_array_equal(output[name], reference[name])
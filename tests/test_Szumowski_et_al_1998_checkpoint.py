@@ -0,0 +1,144 @@
+import os
+import stat
+from tempfile import TemporaryDirectory
+
+import numpy as np
+import pytest
+from Szumowski_et_al_1998_settings import small_settings
+
+from PySDM_examples.Arabas_et_al_2015 import SpinUp
+from PySDM_examples.Szumowski_et_al_1998 import (
+    Checkpoint,
+    MemoryStorage,
+    Simulation,
+    Storage,
+)
+from PySDM_examples.Szumowski_et_al_1998 import checkpoint as checkpoint_module
+from PySDM_examples.utils import DummyController
+
+
+class _InterruptingController(DummyController):
+    def __init__(self, last_percent):
+        super().__init__()
+        self.last_percent = last_percent
+
+    def set_percent(self, value):
+        super().set_percent(value)
+        self.panic = value >= self.last_percent
+
+
+def test_resumed_run_matches_uninterrupted_one():
+    # arrange
+    settings = small_settings(
+        n_steps=8,
+        spin_up_steps=2,
+        processes={"condensation": True},
+        n_sd_per_gridbox=8,
+    )
+    steps = settings.output_steps
+
+    tmp = TemporaryDirectory()
+    reference = Storage(path=os.path.join(tmp.name, "reference"))
+    simulation = Simulation(settings, reference, SpinUp)
+    simulation.reinit()
+    simulation.run()
+
+    checkpoint = Checkpoint(os.path.join(tmp.name, "checkpoint.npz"), interval=2)
+    simulation = Simulation(
+        settings,
+        Storage(path=os.path.join(tmp.name, "resumed")),
+        SpinUp,
+        checkpoint=checkpoint,
+    )
+    simulation.reinit()
+    simulation.run(controller=_InterruptingController(steps[3] / steps[-1]))
+
+    # act
+    resumed = Storage(path=os.path.join(tmp.name, "resumed"))
+    simulation = Simulation(settings, resumed, SpinUp, checkpoint=checkpoint)
+    simulation.reinit(resume=True)
+    simulation.run()
+
+    # assert
+    assert simulation.resume_step == steps[2]
+    for name in simulation.products:
+        if name in ("wall time", "CPU Time"):
+            continue
+        try:
+            expected = reference.load(name)
+        except Storage.Exception:
+            for step in steps:
+                np.testing.assert_array_equal(
+                    resumed.load(name, step), reference.load(name, step)
+                )
+        else:
+            np.testing.assert_array_equal(resumed.load(name), expected)
+
+
+@pytest.mark.parametrize(
+    "breakup, expected",
+    (
+        (False, ("Collision.rnd_opt_coll.rnd",)),
+        (
+            True,
+            (
+                "Collision.rnd_opt_coll.rnd",
+                "Collision.rnd_opt_frag.rnd",
+                "Collision.rnd_opt_proc.rnd",
+            ),
+        ),
+    ),
+)
+def test_pysdm_internals_relied_upon_on_restore(breakup, expected):
+    """random number generators are looked up in the dynamics' attributes
+    and the particle attributes are re-sorted via `healthy` and `sanitize()`,
+    none of which is a public PySDM API"""
+    # arrange
+    settings = small_settings(processes={"breakup": breakup})
+    simulation = Simulation(settings, MemoryStorage(), None)
+    simulation.reinit()
+    attributes = simulation.particulator.attributes
+
+    # act
+    generators = checkpoint_module.random_generators(simulation.particulator)
+    attributes.healthy = False
+    attributes.sanitize()
+
+    # assert
+    assert tuple(sorted(generators)) == expected
+    assert "healthy" in vars(attributes)
+    assert attributes.healthy
+
+
+@pytest.mark.skipif(os.name == "nt", reason="directories cannot be synced on Windows")
+def test_write_syncs_file_and_directory(monkeypatch):
+    # arrange
+    tmp = TemporaryDirectory()
+    path = os.path.join(tmp.name, "checkpoint.npz")
+    synced = []
+    fsync = os.fsync
+
+    def fsync_spy(descriptor):
+        synced.append(stat.S_ISDIR(os.fstat(descriptor).st_mode))
+        fsync(descriptor)
+
+    monkeypatch.setattr(checkpoint_module.os, "fsync", fsync_spy)
+
+    # act
+    checkpoint_module.write(path, {"a": np.arange(3)})
+
+    # assert
+    assert synced == [False, True]
+    assert os.listdir(tmp.name) == ["checkpoint.npz"]
+
+
+def test_resume_rejected_for_storage_without_resume():
+    # arrange
+    tmp = TemporaryDirectory()
+    settings = small_settings()
+    checkpoint = Checkpoint(os.path.join(tmp.name, "checkpoint.npz"))
+    simulation = Simulation(settings, MemoryStorage(), None, checkpoint=checkpoint)
+
+    # act & assert
+    with pytest.raises(ValueError, match="MemoryStorage"):
+        simulation.reinit(resume=True)
@@ -0,0 +1,47 @@
+import os
+from functools import partial
+from tempfile import TemporaryDirectory
+
+import numpy as np
+from Szumowski_et_al_1998_settings import small_settings
+
+from PySDM_examples.Szumowski_et_al_1998 import Ensemble, Storage
+
+SETTINGS = partial(small_settings, processes={"coalescence": False})
+
+
+def test_ensemble_statistics_match_members():
+    # arrange
+    tmp = TemporaryDirectory()
+    sut = Ensemble(
+        SETTINGS, n_members=2, seed=44, n_processes=1, path=tmp.name, keep_members=True
+    )
+
+    # act
+    sut.run()
+
+    # assert
+    assert len(set(sut.seeds)) == 2
+    assert sut.seeds == Ensemble(SETTINGS, n_members=2, seed=44).seeds
+    members = [Storage(path=sut.member_path(member)) for member in range(2)]
+    mean = Storage(path=os.path.join(tmp.name, "mean"))
+    variance = Storage(path=os.path.join(tmp.name, "variance"))
+    for step in SETTINGS(44).output_steps:
+        data = np.array(
+            [member.load("n_c_cm3", step) for member in members], dtype=float
+        )
+        np.testing.assert_allclose(
+            sut.mean("n_c_cm3", step), data.mean(axis=0), rtol=1e-6
+        )
+        np.testing.assert_allclose(
+            sut.variance("n_c_cm3", step), data.var(axis=0, ddof=1), rtol=1e-6
+        )
+        np.testing.assert_allclose(
+            mean.load("n_c_cm3", step), data.mean(axis=0), rtol=1e-6
+        )
+        np.testing.assert_allclose(
+            variance.load("n_c_cm3", step), data.var(axis=0, ddof=1), rtol=1e-6
+        )
+    assert (sut.variance("n_c_cm3", 0) > 0).any()
+    series = np.array([member.load("surf_precip") for member in members])
+    np.testing.assert_allclose(sut.mean("surf_precip"), series.mean(axis=0), rtol=1e-6)
@@ -0,0 +1,114 @@
+import numpy as np
+import pytest
+from PySDM.products import (
+    AmbientDryAirPotentialTemperature,
+    AmbientWaterVapourMixingRatio,
+    ParticleConcentration,
+)
+from Szumowski_et_al_1998_settings import small_settings
+
+from PySDM_examples.Szumowski_et_al_1998 import MemoryStorage, Simulation, mpdata_2d
+from PySDM_examples.Szumowski_et_al_1998.fields import (
+    NondivergentVectorField2D,
+    nondivergent_vector_field_2d,
+)
+
+
+@pytest.mark.parametrize("period", (None, 100))
+def test_precomputed_advector_matches_reference(period):
+    # arrange
+    def stream_function(xX, zZ, t):
+        return 100 * np.sin(np.pi * zZ) * np.cos(2 * np.pi * (xX + t / 100))
+
+    args = ((7, 5), (1500, 1500), 1)
+    sut = NondivergentVectorField2D(*args, stream_function, period=period)
+
+    for t in (0.5, 3, 150.5):
+        # act
+        advector = sut(t)
+
+        # assert
+        expected = nondivergent_vector_field_2d(*args, stream_function, t)
+        for component, expected_component in zip(advector, expected):
+            np.testing.assert_allclose(component, expected_component, atol=1e-12)
+
+
+def test_asynchronous_advection_matches_synchronous():
+    # arrange
+    settings = small_settings(n_steps=6, output_every=3)
+
+    # act
+    storages = {}
+    for asynchronous in (False, True):
+        settings.mpdata_asynchronous = asynchronous
+        storages[asynchronous] = MemoryStorage()
+        simulation = Simulation(settings, storages[asynchronous], None)
+        simulation.reinit(
+            products=[
+                AmbientDryAirPotentialTemperature(name="thd_env", var="thd"),
+                AmbientWaterVapourMixingRatio(name="qv_env", var="qv"),
+                ParticleConcentration(),
+            ]
+        )
+        simulation.run()
+
+    # assert
+    for name in simulation.products:
+        for step in settings.output_steps:
+            np.testing.assert_array_equal(
+                storages[True].load(name, step), storages[False].load(name, step)
+            )
+    assert not np.array_equal(
+        storages[False].load("particle concentration", settings.output_steps[0]),
+        storages[False].load("particle concentration", settings.output_steps[-1]),
+    )
+
+
+def test_advector_settings_forwarded_to_solver():
+    # arrange
+    settings = small_settings(mpdata_courant_check_every=5)
+    settings.stream_function = lambda xX, zZ, t: (
+        np.sin(np.pi * zZ) * np.cos(2 * np.pi * (xX + t / settings.simulation_time))
+    )
+    settings.mpdata_stream_function_period = settings.simulation_time
+    simulation = Simulation(settings, MemoryStorage(), None)
+
+    # act
+    simulation.reinit(products=[ParticleConcentration()])
+
+    # assert
+    solver = simulation.particulator.dynamics["EulerianAdvection"].solvers
+    assert solver.advector.check_every == 5
+    assert len(solver.advector.table) == 2 * settings.simulation_time / settings.dt
+
+
+@pytest.mark.skipif(
+    not mpdata_2d.conf.JIT_FLAGS["parallel"], reason="stepper forced single-threaded"
+)
+def test_n_threads_forwarded_to_stepper(monkeypatch):
+    # arrange
+    requested = []
+    stepper_class = mpdata_2d.Stepper
+
+    def stepper(**kwargs):
+        requested.append(kwargs.get("n_threads"))
+        return stepper_class(**{**kwargs, "n_threads": 1})
+
+    monkeypatch.setattr(mpdata_2d, "Stepper", stepper)
+    simulation = Simulation(small_settings(mpdata_n_threads=3), MemoryStorage(), None)
+
+    # act
+    simulation.reinit(products=[ParticleConcentration()])
+
+    # assert
+    assert requested == [3]
+
+
+def test_n_threads_with_asynchronous_advection_rejected():
+    # arrange
+    settings = small_settings(mpdata_n_threads=2, mpdata_asynchronous=True)
+    simulation = Simulation(settings, MemoryStorage(), None)
+
+    # act & assert
+    with pytest.raises(ValueError, match="n_threads=2"):
+        simulation.reinit(products=[ParticleConcentration()])
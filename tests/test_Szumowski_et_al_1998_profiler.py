@@ -0,0 +1,65 @@
+import os
+import tracemalloc
+from tempfile import TemporaryDirectory
+
+import numpy as np
+import pytest
+from Szumowski_et_al_1998_settings import small_settings
+
+from PySDM_examples.Szumowski_et_al_1998 import MemoryStorage, Profiler, Simulation
+from PySDM_examples.Szumowski_et_al_1998 import profiler as profiler_module
+
+
+def test_profiler_records_dynamics_and_products():
+    # arrange
+    settings = small_settings()
+
+    tmp = TemporaryDirectory()
+    profiler = Profiler(path=os.path.join(tmp.name, "profile.txt"))
+    storage = MemoryStorage()
+    sut = Simulation(settings, storage, None, profiler=profiler)
+    sut.reinit()
+
+    # act
+    sut.run()
+
+    # assert
+    n_outputs = len(settings.output_steps)
+    for key in sut.particulator.dynamics:
+        assert profiler.dynamics[key].calls == settings.n_steps
+        series = storage.load(f"{key} wall time")
+        assert len(series) == n_outputs
+        assert (series[1:] > 0).all()
+    assert profiler.n_steps == settings.n_steps
+    assert profiler.products_evaluated["RH_env"].calls == n_outputs
+    assert sut.product_timing is profiler.products_evaluated
+    np.testing.assert_array_less(0, storage.load("product evaluation wall time")[1:])
+    with open(profiler.path, encoding="utf-8") as file:
+        summary = file.read()
+    assert "dynamic: Displacement" in summary
+    assert "product: RH_env" in summary
+
+
+@pytest.mark.parametrize("reset_peak", (True, False))
+def test_profiler_traces_allocations(monkeypatch, reset_peak):
+    # arrange
+    monkeypatch.setattr(
+        profiler_module, "_RESET_PEAK", reset_peak and profiler_module._RESET_PEAK
+    )
+    sut = Profiler(trace_memory=True)
+    product = sut.products(dynamics=())[-1]
+    tracemalloc.start()
+
+    # act
+    try:
+        with sut.product("ones"):
+            ones = np.ones(2**20)
+    finally:
+        tracemalloc.stop()
+
+    # assert
+    assert ones.nbytes == 8 * 2**20
+    assert sut.products_evaluated["ones"].total_allocated >= 8 * 2**20
+    assert product.name == "product evaluation allocated bytes"
+    assert product.get() >= 8 * 2**20
+    assert product.get() == 0
@@ -0,0 +1,157 @@
+import os
+import subprocess
+import sys
+import time
+from tempfile import TemporaryDirectory
+
+import numpy as np
+from PySDM import Formulae
+from PySDM.backends import CPU
+from PySDM.physics import si
+from Szumowski_et_al_1998_settings import small_settings
+
+from PySDM_examples.Arabas_et_al_2015 import Settings, SpinUp
+from PySDM_examples.Szumowski_et_al_1998 import (
+    GUISettings,
+    MemoryStorage,
+    Simulation,
+    SpinUpCache,
+)
+from PySDM_examples.Szumowski_et_al_1998.make_default_product_collection import (
+    make_default_product_collection,
+)
+
+KEY_SCRIPT = """
+from PySDM import Formulae
+from PySDM.backends import CPU
+from PySDM.physics import si
+from PySDM_examples.Arabas_et_al_2015 import Settings
+from PySDM_examples.Szumowski_et_al_1998 import SpinUpCache
+from PySDM_examples.Szumowski_et_al_1998.make_default_product_collection import (
+    make_default_product_collection,
+)
+
+settings = Settings(Formulae(seed=44))
+print(SpinUpCache.key(settings, make_default_product_collection(settings), CPU))
+"""
+
+
+def _settings(sedimentation=True):
+    return small_settings(
+        n_steps=8,
+        spin_up_steps=4,
+        processes={"condensation": True, "sedimentation": sedimentation},
+        n_sd_per_gridbox=8,
+    )
+
+
+def test_cached_spin_up_matches_uncached_run():
+    # arrange
+    tmp = TemporaryDirectory()
+    cache = SpinUpCache(tmp.name)
+    reference = MemoryStorage()
+    simulation = Simulation(_settings(), reference, SpinUp)
+    simulation.reinit()
+    simulation.run()
+
+    simulation = Simulation(
+        _settings(sedimentation=False), MemoryStorage(), SpinUp, spin_up_cache=cache
+    )
+    simulation.reinit()
+    simulation.run()
+
+    # act
+    cached = MemoryStorage()
+    simulation = Simulation(_settings(), cached, SpinUp, spin_up_cache=cache)
+    simulation.reinit()
+    simulation.run()
+
+    # assert
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert len(cache.entries()) == 1
+    assert simulation.resume_step == 4
+    for name in simulation.products:
+        if name in ("wall time", "CPU Time"):
+            continue
+        try:
+            expected = reference.load(name)
+        except MemoryStorage.Exception:
+            for step in simulation.settings.output_steps:
+                np.testing.assert_array_equal(
+                    cached.load(name, step), reference.load(name, step)
+                )
+        else:
+            np.testing.assert_array_equal(cached.load(name), expected)
+
+
+def test_eviction_by_size_and_age():
+    # arrange
+    tmp = TemporaryDirectory()
+    sut = SpinUpCache(tmp.name, max_size=2000, max_age=3600)
+    now = time.time()
+    for age, key in ((7200, "stale"), (60, "old"), (30, "recent"), (0, "new")):
+        path = os.path.join(tmp.name, f"{key}.npz")
+        with open(path, "wb") as file:
+            file.write(bytes(1000))
+        os.utime(path, (now - age, now - age))
+
+    # act
+    sut.evict()
+
+    # assert
+    assert sorted(os.path.basename(entry) for entry in sut.entries()) == [
+        "new.npz",
+        "recent.npz",
+    ]
+
+
+def test_key_is_the_same_across_processes():
+    # arrange
+    settings = Settings(Formulae(seed=44))
+    env = {name: value for name, value in os.environ.items() if name != "CI"}
+
+    # act
+    keys = [
+        subprocess.run(
+            [sys.executable, "-c", KEY_SCRIPT],
+            check=True,
+            capture_output=True,
+            text=True,
+            env=env,
+        ).stdout.split()[-1]
+        for _ in range(2)
+    ]
+
+    # assert
+    expected = SpinUpCache.key(settings, make_default_product_collection(settings), CPU)
+    assert keys == [expected, expected]
+
+
+def test_key_depends_on_gui_settings_values():
+    # arrange
+    gui_settings = GUISettings(_settings())
+    gui_settings.seed = 44
+    products = make_default_product_collection(gui_settings)
+    before = SpinUpCache.key(gui_settings, products, CPU)
+
+    # act
+    gui_settings.ui_dth0.value = 1
+    after = SpinUpCache.key(gui_settings, products, CPU)
+
+    # assert
+    assert before != after
+
+
+def test_key_depends_on_formulae_constants():
+    # arrange
+    keys = []
+    for constants in (None, {"rho_w": 999 * si.kg / si.m**3}):
+        settings = Settings(Formulae(seed=44, constants=constants))
+
+        # act
+        keys.append(
+            SpinUpCache.key(settings, make_default_product_collection(settings), CPU)
+        )
+
+    # assert
+    assert keys[0] != keys[1]
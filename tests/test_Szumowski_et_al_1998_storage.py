@@ -0,0 +1,431 @@
+import gc
+import os
+import sys
+from collections import namedtuple
+from tempfile import TemporaryDirectory
+from threading import Event
+
+import numpy as np
+import pytest
+
+from PySDM_examples.Szumowski_et_al_1998 import storage_codecs
+from PySDM_examples.Szumowski_et_al_1998.frame_cache import FrameCache
+from PySDM_examples.Szumowski_et_al_1998.memory_storage import MemoryStorage
+from PySDM_examples.Szumowski_et_al_1998.storage import Storage
+from PySDM_examples.Szumowski_et_al_1998.write_behind import WriteBehind
+
+SETTINGS = namedtuple("Settings", "grid output_steps")(
+    grid=(4, 3), output_steps=np.arange(0, 31, 10)
+)
+
+
+class TestStorage:
+    @staticmethod
+    @pytest.mark.parametrize("memmap", (False, True))
+    def test_save_load_roundtrip(memmap):
+        # arrange
+        sut = Storage(memmap=memmap)
+        sut.init(SETTINGS)
+        fields = {
+            step: np.random.random((*SETTINGS.grid, 2))
+            for step in SETTINGS.output_steps
+        }
+
+        # act
+        for step, data in fields.items():
+            sut.save(data, step, "spectrum")
+
+        # assert
+        for step, data in fields.items():
+            np.testing.assert_array_equal(
+                sut.load("spectrum", step), data.astype(sut.dtype)
+            )
+        assert sut.data_range("spectrum") == (
+            min(np.amin(data) for data in fields.values()),
+            max(np.amax(data) for data in fields.values()),
+        )
+
+    @staticmethod
+    def test_memmap_single_file_per_product():
+        # arrange
+        sut = Storage(memmap=True)
+        sut.init(SETTINGS)
+
+        # act
+        for step in SETTINGS.output_steps[:2]:
+            sut.save(np.zeros(SETTINGS.grid), step, "field")
+
+        # assert
+        assert sorted(os.listdir(sut.dir_path)) == ["field.npy", "field.stats.npy"]
+        assert np.load(sut._filepath("field")).shape == (
+            len(SETTINGS.output_steps),
+            *SETTINGS.grid,
+        )
+        with pytest.raises(Storage.Exception):
+            sut.load("field", SETTINGS.output_steps[-1])
+
+    @staticmethod
+    def test_memmap_field_and_series_loaded_whole():
+        # arrange
+        path = TemporaryDirectory()
+        sut = Storage(path=path.name, memmap=True)
+        sut.init(SETTINGS)
+        for step in SETTINGS.output_steps:
+            sut.save(np.full(SETTINGS.grid, step), step, "field")
+            sut.save(float(step), step, "wall time")
+        sut.flush()
+
+        # act
+        fields = (sut.load("field"), Storage(path=path.name, memmap=True).load("field"))
+        series = sut.load("wall time")
+
+        # assert
+        for field in fields:
+            assert field.shape == (len(SETTINGS.output_steps), *SETTINGS.grid)
+            np.testing.assert_array_equal(field[:, 0, 0], SETTINGS.output_steps)
+        assert not fields[0].flags.writeable
+        np.testing.assert_array_equal(series, SETTINGS.output_steps)
+        with pytest.raises(Storage.Exception):
+            sut.load("missing")
+
+    @staticmethod
+    def test_memmap_frames_loaded_read_only():
+        # arrange
+        sut = Storage(memmap=True)
+        sut.init(SETTINGS)
+        sut.save(np.zeros(SETTINGS.grid), 0, "field")
+
+        # act
+        frame = sut.load("field", 0)
+
+        # assert
+        assert not frame.flags.writeable
+        with pytest.raises(ValueError):
+            frame[0, 0] = 1
+        np.testing.assert_array_equal(sut.load("field", 0), 0)
+
+    @staticmethod
+    def test_memmap_with_codecs_rejected(monkeypatch):
+        # arrange
+        unraisable = []
+        monkeypatch.setattr(sys, "unraisablehook", unraisable.append)
+
+        # act
+        with pytest.raises(ValueError):
+            Storage(memmap=True, codecs={"field": storage_codecs.Lossless()})
+        gc.collect()
+
+        # assert
+        assert not unraisable
+
+    @staticmethod
+    def test_scalar_series_appended_and_restarted_at_step_zero():
+        # arrange
+        sut = Storage()
+        sut.init(SETTINGS)
+        values = (1.0, 2.0, 4.0)
+
+        # act
+        for step, value in zip(SETTINGS.output_steps, values):
+            sut.save(value, step, "wall time")
+        series = sut.load("wall time")
+        sut.save(8.0, 0, "wall time")
+
+        # assert
+        np.testing.assert_array_equal(series, values)
+        assert series.dtype == sut.dtype
+        np.testing.assert_array_equal(sut.load("wall time"), (8.0,))
+        assert sut.data_range("wall time") == (1.0, 8.0)
+
+    @staticmethod
+    def test_statistics_persisted_per_step():
+        # arrange
+        path = TemporaryDirectory()
+        sut = Storage(path=path.name)
+        sut.init(SETTINGS)
+        data = np.arange(np.prod(SETTINGS.grid), dtype=float).reshape(SETTINGS.grid)
+        data[0, :] = np.nan
+
+        # act
+        sut.save(data, SETTINGS.output_steps[1], "field")
+        sut.save(np.full(SETTINGS.grid, np.nan), SETTINGS.output_steps[2], "field")
+        sut.flush()
+        stats = Storage(path=path.name).statistics("field")
+
+        # assert
+        assert tuple(stats["nan_count"]) == (-1, SETTINGS.grid[1], data.size, -1)
+        record = sut.statistics("field", SETTINGS.output_steps[1])
+        assert (record["min"], record["max"]) == (np.nanmin(data), np.nanmax(data))
+        assert record["mean"] == np.nanmean(data)
+        assert record["histogram"].sum() == data.size - SETTINGS.grid[1]
+        assert Storage(path=path.name).data_range("field") == sut.data_range("field")
+        with pytest.raises(Storage.Exception):
+            sut.statistics("field", SETTINGS.output_steps[0])
+
+    @staticmethod
+    def test_statistics_of_finite_values_only():
+        # arrange
+        path = TemporaryDirectory()
+        sut = Storage(path=path.name)
+        sut.init(SETTINGS)
+        data = np.arange(np.prod(SETTINGS.grid), dtype=float).reshape(SETTINGS.grid)
+        data[0, 0] = np.inf
+        data[0, 1] = -np.inf
+
+        # act
+        sut.save(data, SETTINGS.output_steps[1], "field")
+        sut.flush()
+
+        # assert
+        record = sut.statistics("field", SETTINGS.output_steps[1])
+        finite = data[np.isfinite(data)]
+        assert record["nan_count"] == 2
+        assert (record["min"], record["max"]) == (finite.min(), finite.max())
+        assert record["mean"] == finite.mean()
+        assert record["histogram"].sum() == finite.size
+        assert Storage(path=path.name).data_range("field") == (
+            finite.min(),
+            finite.max(),
+        )
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "codec, rtol",
+        (
+            (storage_codecs.Lossless(), 0),
+            (storage_codecs.Float16(), 1e-3),
+            (storage_codecs.BitRound(keepbits=7), 2**-8),
+            (storage_codecs.Sparse(), 0),
+            (storage_codecs.Sparse(fill_value=np.nan, compress=True), 0),
+        ),
+    )
+    def test_codecs_roundtrip(codec, rtol):
+        # arrange
+        path = TemporaryDirectory()
+        sut = Storage(path=path.name, codecs={"field": codec})
+        sut.init(SETTINGS)
+        data = np.zeros((*SETTINGS.grid, 5))
+        data[1, 1:, :] = np.random.random((SETTINGS.grid[1] - 1, 5)) + 1
+        data[2, :, 0] = np.nan
+
+        # act
+        sut.save(data, SETTINGS.output_steps[1], "field")
+        loaded = Storage(path=path.name).load("field", SETTINGS.output_steps[1])
+
+        # assert
+        assert loaded.dtype == sut.dtype
+        np.testing.assert_allclose(loaded, data.astype(sut.dtype), rtol=rtol)
+
+    @staticmethod
+    @pytest.mark.parametrize("memmap", (False, True))
+    def test_resume_discards_steps_after_checkpoint(memmap):
+        # arrange
+        path = TemporaryDirectory()
+        storage = Storage(path=path.name, memmap=memmap)
+        storage.init(SETTINGS)
+        for step in SETTINGS.output_steps[:3]:
+            storage.save(np.full(SETTINGS.grid, step), step, "field")
+            storage.save(float(step), step, "scalar")
+        storage.flush()
+
+        # act
+        sut = Storage(path=path.name, memmap=memmap)
+        sut.resume(SETTINGS, SETTINGS.output_steps[1])
+
+        # assert
+        np.testing.assert_array_equal(sut.load("scalar"), SETTINGS.output_steps[:2])
+        np.testing.assert_array_equal(sut.load("field", SETTINGS.output_steps[1]), 10)
+        with pytest.raises(Storage.Exception):
+            sut.load("field", SETTINGS.output_steps[2])
+        assert sut.data_range("field") == (0, SETTINGS.output_steps[1])
+
+    @staticmethod
+    @pytest.mark.parametrize("memmap", (False, True))
+    def test_pyramid_levels_coarsened_nan_aware(memmap):
+        # arrange
+        sut = Storage(memmap=memmap, pyramid_levels=(2,))
+        sut.init(SETTINGS)
+        data = np.arange(np.prod(SETTINGS.grid), dtype=float).reshape(SETTINGS.grid)
+        data[0, 0] = np.nan
+
+        # act
+        sut.save(data, SETTINGS.output_steps[1], "field")
+        coarse = sut.load("field", SETTINGS.output_steps[1], level=2)
+
+        # assert
+        assert coarse.shape == (2, 2)
+        np.testing.assert_allclose(
+            coarse,
+            [[(1 + 3 + 4) / 3, (2 + 5) / 2], [(6 + 7 + 9 + 10) / 4, (8 + 11) / 2]],
+            rtol=1e-6,
+        )
+        np.testing.assert_array_equal(
+            sut.load("field", SETTINGS.output_steps[1]), data.astype(sut.dtype)
+        )
+        assert sut.pyramid_level((4, 3)) == 1
+        assert sut.pyramid_level((2, 2)) == 2
+        assert sut.pyramid_level((1, 1)) == 2
+
+
+class TestWriteBehind:
+    @staticmethod
+    def test_snapshots_copied_and_written_after_flush():
+        # arrange
+        sut = WriteBehind(Storage(), max_pending=1)
+        sut.init(SETTINGS)
+        snapshot = np.empty(SETTINGS.grid)
+
+        # act
+        for step in SETTINGS.output_steps:
+            snapshot[:] = step
+            sut.save(snapshot, step, "field")
+            sut.save(float(step), step, "scalar")
+        sut.flush()
+
+        # assert
+        for step in SETTINGS.output_steps:
+            np.testing.assert_array_equal(sut.load("field", step), step)
+        np.testing.assert_array_equal(sut.load("scalar"), SETTINGS.output_steps)
+        assert sut.data_range("field") == (0, SETTINGS.output_steps[-1])
+
+    @staticmethod
+    def test_writer_errors_reraised_on_flush():
+        # arrange
+        sut = WriteBehind(Storage())
+        sut.init(SETTINGS)
+
+        # act
+        sut.save(np.zeros(3), 0, "wrong shape")
+
+        # assert
+        with pytest.raises(NotImplementedError):
+            sut.flush()
+
+
+class TestFrameCache:
+    @staticmethod
+    def test_lru_eviction_bounded_by_bytes():
+        # arrange
+        storage = Storage()
+        storage.init(SETTINGS)
+        for step in SETTINGS.output_steps:
+            storage.save(np.full(SETTINGS.grid, step), step, "field")
+        frame_bytes = np.empty(SETTINGS.grid, dtype=storage.dtype).nbytes
+        sut = FrameCache(storage, max_bytes=2 * frame_bytes)
+
+        # act
+        for step in SETTINGS.output_steps[:3]:
+            sut.load("field", step)
+        sut.load("field", SETTINGS.output_steps[1])
+        sut.load("field", SETTINGS.output_steps[3])
+
+        # assert
+        assert tuple(sut._frames.keys()) == (
+            ("field", SETTINGS.output_steps[1], 1),
+            ("field", SETTINGS.output_steps[3], 1),
+        )
+        with pytest.raises(ValueError):
+            sut.load("field", SETTINGS.output_steps[1])[:] = 0
+
+    @staticmethod
+    def test_prefetch_skips_missing_frames():
+        # arrange
+        storage = Storage()
+        storage.init(SETTINGS)
+        storage.save(np.zeros(SETTINGS.grid), SETTINGS.output_steps[0], "field")
+        sut = FrameCache(storage)
+
+        # act
+        sut.prefetch({"field": 1}, SETTINGS.output_steps[:2])
+        sut._executor.shutdown(wait=True)
+
+        # assert
+        assert tuple(sut._frames.keys()) == (("field", SETTINGS.output_steps[0], 1),)
+
+    @staticmethod
+    def test_frame_loaded_before_clear_not_inserted():
+        # arrange
+        storage = Storage()
+        storage.init(SETTINGS)
+        storage.save(np.zeros(SETTINGS.grid), SETTINGS.output_steps[0], "field")
+        loading, cleared = Event(), Event()
+
+        class BlockingStorage:
+            Exception = Storage.Exception
+
+            @staticmethod
+            def load(*args):
+                loading.set()
+                cleared.wait()
+                return storage.load(*args)
+
+        sut = FrameCache(BlockingStorage())
+
+        # act
+        sut.prefetch({"field": 1}, SETTINGS.output_steps[:1])
+        loading.wait()
+        sut.clear()
+        cleared.set()
+        sut._executor.shutdown(wait=True)
+
+        # assert
+        assert not sut._frames
+        assert sut._n_bytes == 0
+
+
+class TestMemoryStorage:
+    @staticmethod
+    def test_ring_buffer_keeps_last_steps():
+        # arrange
+        sut = MemoryStorage(keep_last=2)
+        sut.init(SETTINGS)
+
+        # act
+        for step in SETTINGS.output_steps:
+            sut.save(np.full(SETTINGS.grid, step), step, "field")
+            sut.save(float(step), step, "scalar")
+
+        # assert
+        for step in SETTINGS.output_steps[:-2]:
+            with pytest.raises(MemoryStorage.Exception):
+                sut.load("field", step)
+        for step in SETTINGS.output_steps[-2:]:
+            np.testing.assert_array_equal(sut.load("field", step), step)
+        np.testing.assert_array_equal(sut.load("scalar"), SETTINGS.output_steps)
+        assert sut.data_range("field") == (0, SETTINGS.output_steps[-1])
+        assert tuple(sut.statistics("field")["nan_count"]) == (-1, -1, 0, 0)
+        with pytest.raises(ValueError):
+            sut.load("field", SETTINGS.output_steps[-1])[:] = 0
+
+    @staticmethod
+    def test_scalar_series_started_after_first_step():
+        # arrange
+        sut = MemoryStorage()
+        sut.init(SETTINGS)
+
+        # act
+        for step in SETTINGS.output_steps[1:]:
+            sut.save(float(step), step, "scalar")
+
+        # assert
+        np.testing.assert_array_equal(sut.load("scalar"), SETTINGS.output_steps[1:])
+
+    @staticmethod
+    def test_spills_to_disk_above_memory_cap():
+        # arrange
+        frame = np.ones((*SETTINGS.grid, 2))
+        sut = MemoryStorage(max_bytes=len(SETTINGS.output_steps) * frame.size * 4)
+        sut.init(SETTINGS)
+
+        # act
+        for step in SETTINGS.output_steps:
+            sut.save(frame * step, step, "first")
+            sut.save(frame * step, step, "second")
+
+        # assert
+        assert "first" in sut._fields and "second" not in sut._fields
+        assert os.listdir(sut.spill.dir_path)
+        for name in ("first", "second"):
+            for step in SETTINGS.output_steps:
+                np.testing.assert_array_equal(sut.load(name, step), frame * step)
+            assert sut.data_range(name) == (0, SETTINGS.output_steps[-1])
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+from Szumowski_et_al_1998_settings import small_settings
+
+from PySDM_examples.Szumowski_et_al_1998 import (
+    MemoryStorage,
+    Simulation,
+    Subscriptions,
+)
+
+
+def test_only_subscribed_products_are_evaluated():
+    # arrange
+    settings = small_settings(n_steps=6)
+
+    subscriptions = Subscriptions()
+    subscriptions.subscribe("storage", names=("n_c_cm3", "wall time"), every=2)
+    subscriptions.subscribe("viewer", names=("RH_env", "surf_precip"))
+    storage = MemoryStorage()
+    sut = Simulation(settings, storage, None, subscriptions=subscriptions)
+    sut.reinit()
+
+    # act
+    sut.run()
+
+    # assert
+    steps = settings.output_steps
+    for index, step in enumerate(steps):
+        storage.load("RH_env", step)
+        if index % 2 == 0:
+            storage.load("n_c_cm3", step)
+        else:
+            with pytest.raises(MemoryStorage.Exception):
+                storage.load("n_c_cm3", step)
+        with pytest.raises(MemoryStorage.Exception):
+            storage.load("Particles Wet Size Spectrum", step)
+    assert len(storage.load("surf_precip")) == len(steps)
+    wall_time = storage.load("wall time")
+    assert len(wall_time) == len(steps)
+    assert not np.isnan(wall_time[::2]).any()
+    assert np.isnan(wall_time[1::2]).all()
+    assert {name: probe.calls for name, probe in sut.product_timing.items()} == {
+        "RH_env": len(steps),
+        "surf_precip": len(steps),
+        "n_c_cm3": (len(steps) + 1) // 2,
+        "wall time": (len(steps) + 1) // 2,
+    }
+    assert "n_c_cm3" in sut.product_report()
@@ -0,0 +1,67 @@
+from tempfile import TemporaryDirectory
+
+import numpy as np
+import pytest
+
+from PySDM_examples.Arabas_et_al_2015 import Settings
+from PySDM_examples.Szumowski_et_al_1998 import GUISettings, Sweep
+from PySDM_examples.Szumowski_et_al_1998.sweep import apply
+
+SMALL = {
+    "nx": 10,
+    "nz": 10,
+    "dt": 60,
+    "simulation_time": 1800,
+    "sdpg": 1,
+    "output_options.interval": 900,
+    "processes.condensation": False,
+    "processes.coalescence": False,
+}
+
+
+def test_latin_hypercube_samples_each_stratum_once():
+    # act
+    samples = Sweep.latin_hypercube(8, seed=44, dth0=(0, 4), kappa=(0.5, 1.5))
+
+    # assert
+    assert len(samples) == 8
+    for name, low in (("dth0", 0), ("kappa", 0.5)):
+        strata = sorted(
+            int((sample[name] - low) / (4 if low == 0 else 1) * 8) for sample in samples
+        )
+        assert strata == list(range(8))
+    assert len(Sweep.grid(dth0=(1, 2, 3), kappa=(0.5, 1))) == 6
+
+
+def test_apply_rejects_values_outside_widget_range():
+    # arrange
+    sut = GUISettings(Settings())
+
+    # act
+    apply(sut, {"dth0": 1.5, "freezing.model": "singular", "nx": 32.0})
+
+    # assert
+    assert sut.widget("dth0").value == 1.5
+    assert sut.grid[0] == 32
+    with pytest.raises(ValueError):
+        apply(sut, {"sdpg": 10**6})
+
+
+def test_sweep_reuses_cached_members():
+    # arrange
+    tmp = TemporaryDirectory()
+    sut = Sweep(tmp.name, Settings, n_processes=1)
+    sample = {**SMALL, "dth0": 1.0}
+
+    # act
+    first = sut.run([sample])
+    second = sut.run([sample, {**sample}])
+
+    # assert
+    assert (sut.misses, sut.hits) == (1, 2)
+    assert sut.key(sample) != sut.key({**SMALL, "dth0": 2.0})
+    assert second[0].dir_path == second[1].dir_path == first[0].dir_path
+    np.testing.assert_array_equal(
+        first[0].load("surf_precip"), second[0].load("surf_precip")
+    )
+    assert len(second[0].load("surf_precip")) == 3
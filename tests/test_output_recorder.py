@@ -0,0 +1,43 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from PySDM_examples.utils import OutputRecorder
+
+
+class _Product:
+    def __init__(self, values):
+        self.values = iter(values)
+
+    def get(self):
+        return next(self.values)
+
+
+def test_output_recorder_preallocates_and_skips():
+    # arrange
+    n_outputs = 4
+    particulator = SimpleNamespace(
+        products={
+            "T": _Product(np.full((1,), value) for value in range(n_outputs)),
+            "spectrum": _Product(np.full((3, 1), value) for value in range(2)),
+            "count": _Product(np.array([value]) for value in range(n_outputs)),
+        }
+    )
+    sut = OutputRecorder(
+        names=("T", "spectrum"),
+        steps=np.arange(n_outputs) * 5,
+        dt=2,
+        every={"spectrum": 2},
+    )
+
+    # act
+    for _ in range(n_outputs):
+        sut.record(particulator)
+
+    # assert
+    assert sorted(sut) == ["T", "spectrum"]
+    np.testing.assert_array_equal(sut.t, (0, 10, 20, 30))
+    np.testing.assert_array_equal(sut["T"], np.arange(n_outputs))
+    assert sut["spectrum"].shape == (n_outputs, 3, 1)
+    np.testing.assert_array_equal(sut["spectrum"][::2, :, 0], ((0, 0, 0), (1, 1, 1)))
+    assert np.isnan(sut["spectrum"][1::2]).all()
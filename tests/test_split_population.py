@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from PySDM_examples.utils import split_population
+
+
+def test_split_population():
+    # arrange
+    n_sd = 5
+    attributes = {
+        "n": np.arange(1, n_sd + 1, dtype=float) * 10,
+        "freezing temperature": np.linspace(250, 260, n_sd),
+        "cell id": np.arange(n_sd),
+        "cell origin": np.arange(2 * n_sd).reshape(2, n_sd),
+    }
+
+    # act
+    sut = split_population(
+        attributes, fractions=(0.25, 0.75), fill={"freezing temperature": (None, 0)}
+    )
+
+    # assert
+    for name, array in sut.items():
+        assert array.shape == (*attributes[name].shape[:-1], 2 * n_sd)
+        assert array.dtype == attributes[name].dtype
+    np.testing.assert_array_equal(sut["n"][:n_sd], attributes["n"] * 0.25)
+    np.testing.assert_array_equal(sut["n"][n_sd:], attributes["n"] * 0.75)
+    np.testing.assert_array_equal(
+        sut["freezing temperature"][:n_sd], attributes["freezing temperature"]
+    )
+    np.testing.assert_array_equal(sut["freezing temperature"][n_sd:], 0)
+    np.testing.assert_array_equal(sut["cell id"], np.tile(attributes["cell id"], 2))
+    np.testing.assert_array_equal(
+        sut["cell origin"], np.tile(attributes["cell origin"], (1, 2))
+    )
+
+
+def test_split_population_validates_sizes():
+    # arrange
+    attributes = {"n": np.ones(4), "volume": np.ones(3)}
+
+    # act
+    with pytest.raises(AssertionError) as exception_info:
+        split_population(attributes, fractions=(0.5, 0.5))
+
+    # assert
+    assert ">>volume<<" in str(exception_info.value)
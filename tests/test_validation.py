@@ -0,0 +1,72 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from PySDM_examples.Szumowski_et_al_1998.fields import NondivergentVectorField2D
+from PySDM_examples.utils import (
+    checks_enabled,
+    get_validation_level,
+    set_validation_level,
+    validation_level,
+)
+
+
+@pytest.mark.parametrize(
+    "level, expected",
+    (("off", (False, False)), ("default", (True, False)), ("paranoid", (True, True))),
+)
+def test_checks_enabled(level, expected):
+    # arrange
+    previous = get_validation_level()
+
+    # act
+    with validation_level(level):
+        enabled = (checks_enabled(), checks_enabled("paranoid"))
+
+    # assert
+    assert enabled == expected
+    assert get_validation_level() == previous
+
+
+def test_invalid_level():
+    with pytest.raises(ValueError):
+        set_validation_level("strict")
+
+
+def test_invalid_environment_level_falls_back_to_default():
+    # arrange
+    env = {**os.environ, "PySDM_EXAMPLES_VALIDATION": "strict"}
+    script = (
+        "from PySDM_examples.utils import get_validation_level;"
+        "print(get_validation_level())"
+    )
+
+    # act
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # assert
+    assert result.stdout.split()[-1] == "default"
+    assert "PySDM_EXAMPLES_VALIDATION='strict'" in result.stderr
+
+
+def test_courant_check_respects_validation_level():
+    # arrange
+    def stream_function(xX, zZ, t):
+        return 1e6 * np.sin(np.pi * zZ) * np.cos(2 * np.pi * (xX + t))
+
+    sut = NondivergentVectorField2D((4, 4), (100, 100), 1, stream_function)
+
+    # act & assert
+    with validation_level("off"):
+        sut(0.5)
+    with pytest.raises(AssertionError):
+        sut(0.5)